@@ -0,0 +1,47 @@
+#Import-time benchmark for 'import finflux'
+#   python benchmarks/import_time.py [--runs 10] [--budget 0.25]
+#Exits with status 1 if the median cold import exceeds the budget (seconds) or if a heavy
+#dependency is loaded eagerly, so it can be wired into CI to catch startup regressions.
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ['yfinance', 'pandas', 'numpy', 'matplotlib', 'requests']
+
+PROBE = f'''
+import sys, time, json
+start = time.perf_counter()
+import finflux
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+'''
+
+def run_once(root):
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    result = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, env=env, check=True)
+    return json.loads(result.stdout)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget', type=float, default=0.25)
+    args = parser.parse_args()
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    samples = [run_once(root) for _ in range(args.runs)]
+
+    median = statistics.median(sample['seconds'] for sample in samples)
+    loaded = sorted({module for sample in samples for module in sample['loaded']})
+
+    print(f'import finflux: median {median * 1000:.1f} ms over {args.runs} runs (budget {args.budget * 1000:.0f} ms)')
+    print(f'heavy modules loaded at import: {", ".join(loaded) if loaded else "none"}')
+
+    if median > args.budget or loaded:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
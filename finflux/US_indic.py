@@ -1,8 +1,8 @@
 from finflux.base_var import Config
+from finflux.transport import transport, fan_out
+from finflux.aio import awaitable
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta, datetime
 import json
@@ -21,6 +21,7 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class US_indic:
 #------------------------------------------------------------------------------------------
     def help(self):
@@ -100,7 +101,7 @@ class US_indic():
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BEA
         url = f'https://apps.bea.gov/api/data/?&UserID={Config.bea_apikey}' + '&method=GetData' + '&datasetname=NIPA' + f'&TableName={identifiers[type][0]}' + '&Frequency=Q' + '&Year=X'
-        response = requests.get(url).json()
+        response = transport.get(url).json()
         #----------------------------------------------------------------------------------
 
         data_list = response['BEAAPI']['Results']['Data']
@@ -187,7 +188,7 @@ class US_indic():
             
             headers = {'Content-type': 'application/json'}
             data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
+            response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
 
             data_list = response['Results']['series'][0]['data'][::-1]
 
@@ -195,34 +196,23 @@ class US_indic():
             end_year = str(datetime.now().year)
             headers = {'Content-type': 'application/json'}
 
-            def dlist(response):
+            def dlist(years):
+                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":years[0], "endyear":years[1], 'registrationkey':Config.bls_apikey})
+                response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
                 return response['Results']['series'][0]['data']
 
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2011', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response_1 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-            data_list = dlist(response_1)
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1991', "endyear":'2010', 'registrationkey':Config.bls_apikey})
-            response_2 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-            data_list.extend(dlist(response_2))
+            year_windows = [('2011', end_year), ('1991', '2010')]
 
             if type not in ('p', 'cp'):
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1971', "endyear":'1990', 'registrationkey':Config.bls_apikey})
-                response_3 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                data_list.extend(dlist(response_3))
-
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1951', "endyear":'1970', 'registrationkey':Config.bls_apikey})
-                response_4 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                data_list.extend(dlist(response_4))
+                year_windows += [('1971', '1990'), ('1951', '1970')]
 
                 if type not in ('cc'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1931', "endyear":'1950', 'registrationkey':Config.bls_apikey})
-                    response_5 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_5))
+                    year_windows += [('1931', '1950'), ('1911', '1930')]
 
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1911', "endyear":'1930', 'registrationkey':Config.bls_apikey})
-                    response_6 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_6))
+            #requesting every year window concurrently, then stitching them newest to oldest
+            data_list = []
+            for window_data in fan_out(dlist, year_windows):
+                data_list.extend(window_data)
             
             data_list = data_list[::-1]
 
@@ -308,7 +298,7 @@ class US_indic():
 
         #RAW DATA/OBSERVATION-----------------------------------------------------------BEA
         url = f'https://apps.bea.gov/api/data/?&UserID={Config.bea_apikey}' + '&method=GetData' + '&datasetname=NIPA' + f'&TableName={identifiers[type][0]}' + '&Frequency=M' + '&Year=X'
-        response = requests.get(url).json()
+        response = transport.get(url).json()
         #----------------------------------------------------------------------------------
 
         data_list = response['BEAAPI']['Results']['Data']
@@ -407,7 +397,7 @@ class US_indic():
             
             headers = {'Content-type': 'application/json'}
             data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
+            response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
 
             data_list = response['Results']['series'][0]['data'][::-1]
 
@@ -415,31 +405,26 @@ class US_indic():
             end_year = str(datetime.now().year)
             headers = {'Content-type': 'application/json'}
 
-            def dlist(response):
+            def dlist(years):
+                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":years[0], "endyear":years[1], 'registrationkey':Config.bls_apikey})
+                response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
                 return response['Results']['series'][0]['data']
 
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2021', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-            response_1 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-            data_list = dlist(response_1)
-
-            data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2001', "endyear":'2020', 'registrationkey':Config.bls_apikey})
-            response_2 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-            data_list.extend(dlist(response_2))
+            year_windows = [('2021', end_year), ('2001', '2020')]
 
             if type not in ('r=asian'):
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1981', "endyear":'2000', 'registrationkey':Config.bls_apikey})
-                response_3 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                data_list.extend(dlist(response_3))
+                year_windows += [('1981', '2000')]
 
                 if type not in ('U-6', 'e<hs', 'e=hs', 'e<bach', 'e>=bach'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1961', "endyear":'1980', 'registrationkey':Config.bls_apikey})
-                    response_4 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_4))
+                    year_windows += [('1961', '1980')]
 
                     if type not in ('r=black', 'r=hispanic'):
-                        data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1941', "endyear":'1960', 'registrationkey':Config.bls_apikey})
-                        response_5 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                        data_list.extend(dlist(response_5))
+                        year_windows += [('1941', '1960')]
+
+            #requesting every year window concurrently, then stitching them newest to oldest
+            data_list = []
+            for window_data in fan_out(dlist, year_windows):
+                data_list.extend(window_data)
             
             data_list = data_list[::-1]
         #----------------------------------------------------------------------------------
@@ -525,7 +510,7 @@ class US_indic():
                 
                 headers = {'Content-type': 'application/json'}
                 data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":start_year, "endyear":end_year, 'registrationkey':Config.bls_apikey})
-                response = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
+                response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
 
                 data_list = response['Results']['series'][0]['data'][::-1]
 
@@ -533,35 +518,26 @@ class US_indic():
                 end_year = str(datetime.now().year)
                 headers = {'Content-type': 'application/json'}
 
-                def dlist(response):
+                def dlist(years):
+                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":years[0], "endyear":years[1], 'registrationkey':Config.bls_apikey})
+                    response = transport.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
                     return response['Results']['series'][0]['data']
 
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'2011', "endyear":end_year, 'registrationkey':Config.bls_apikey})
-                response_1 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                data_list = dlist(response_1)
-
-                data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1991', "endyear":'2010', 'registrationkey':Config.bls_apikey})
-                response_2 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                data_list.extend(dlist(response_2))
+                year_windows = [('2011', end_year), ('1991', '2010')]
 
                 if type not in ('quits', 'openings', 'earnings'):
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1971', "endyear":'1990', 'registrationkey':Config.bls_apikey})
-                    response_3 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_3))
-
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1951', "endyear":'1970', 'registrationkey':Config.bls_apikey})
-                    response_4 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_4))
+                    year_windows += [('1971', '1990'), ('1951', '1970'), ('1931', '1950')]
 
-                    data = json.dumps({"seriesid": [identifiers[type][0]],"startyear":'1931', "endyear":'1950', 'registrationkey':Config.bls_apikey})
-                    response_5 = requests.post('https://api.bls.gov/publicAPI/v2/timeseries/data/', data=data, headers=headers).json()
-                    data_list.extend(dlist(response_5))
+                #requesting every year window concurrently, then stitching them newest to oldest
+                data_list = []
+                for window_data in fan_out(dlist, year_windows):
+                    data_list.extend(window_data)
                 
                 data_list = data_list[::-1]
 
         if type == 'claims':
             FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={identifiers[type][0]}&api_key={Config.fred_apikey}&file_type=json'
-            data_list = requests.get(FRED_url).json()['observations']
+            data_list = transport.get(FRED_url).json()['observations']
         #----------------------------------------------------------------------------------
 
         month_to_month = {
@@ -647,7 +623,7 @@ class US_indic():
         id = FRED_IDs[type][0]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_yield = requests.get(FRED_url).json()
+        FRED_yield = transport.get(FRED_url).json()
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
@@ -729,7 +705,7 @@ class US_indic():
         id = FRED_IDs[interval][0]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_rate = requests.get(FRED_url).json()
+        FRED_rate = transport.get(FRED_url).json()
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
@@ -785,7 +761,7 @@ class US_indic():
         
         #RAW DATA/OBSERVATION----------------------------------------------------------FRED
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={identifiers[type][0]}&api_key={Config.fred_apikey}&file_type=json'
-        data_list = requests.get(FRED_url).json()['observations']
+        data_list = transport.get(FRED_url).json()['observations']
         #----------------------------------------------------------------------------------
         
         def is_numeric(str):
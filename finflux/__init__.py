@@ -1,9 +1,42 @@
 from .base_var import set_config
-from .equity import equity
-from .fund import fund
-from .forex import forex
-from .crypto import crypto
-from .bond import bond
-from .US_indic import US_indic
-
-__all__ = ['set_config', 'equity', 'fund', 'forex', 'crypto', 'bond', 'US_indic']
\ No newline at end of file
+
+import importlib
+import sys
+import types
+
+#security/indicator classes are imported on first access so 'import finflux' does not pull in
+#yfinance, pandas and numpy until one of them is actually used
+_lazy_classes = {
+    'equity': '.equity',
+    'fund': '.fund',
+    'forex': '.forex',
+    'crypto': '.crypto',
+    'bond': '.bond',
+    'US_indic': '.US_indic',
+    'stream': '.stream',
+    'portfolio': '.portfolio',
+}
+
+__all__ = ['set_config', 'equity', 'fund', 'forex', 'crypto', 'bond', 'US_indic', 'stream', 'portfolio']
+
+def __getattr__(name):
+    if name in _lazy_classes:
+        module = importlib.import_module(_lazy_classes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+class _LazyPackage(types.ModuleType):
+    #the import system binds a submodule onto its package once it is loaded (finflux.fund ->
+    #<module finflux.fund>); keep the class under that name, as the eager imports used to
+    def __setattr__(self, name, value):
+        if name in _lazy_classes and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _LazyPackage
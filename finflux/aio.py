@@ -0,0 +1,45 @@
+from finflux.base_var import Config
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+#------------------------------------------------------------------------------------------
+_executor = None
+_executor_lock = threading.Lock()
+
+def executor():
+    #one shared worker pool for every awaitable method, sized by set_config(async_workers=...)
+    global _executor
+
+    with _executor_lock:
+        if _executor is None or _executor._max_workers != Config.async_workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(max_workers=Config.async_workers, thread_name_prefix='finflux')
+
+    return _executor
+#------------------------------------------------------------------------------------------
+def _awaitable_method(method):
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor(), functools.partial(method, self, *args, **kwargs))
+
+    wrapper.__name__ = f'a{method.__name__}'
+    wrapper.__qualname__ = wrapper.__qualname__.rsplit('.', 1)[0] + f'.a{method.__name__}'
+    return wrapper
+
+def awaitable(cls):
+    #adding an 'a' prefixed coroutine (quote -> aquote, gdp -> agdp) for every public data method,
+    #classmethod batch entry points included (timeseries_many -> atimeseries_many)
+    for name, method in list(vars(cls).items()):
+        if name.startswith('_') or name == 'help':
+            continue
+        if isinstance(method, classmethod):
+            setattr(cls, f'a{name}', classmethod(_awaitable_method(method.__func__)))
+        elif callable(method):
+            setattr(cls, f'a{name}', _awaitable_method(method))
+
+    return cls
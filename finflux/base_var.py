@@ -1,3 +1,17 @@
+import os
+
+default_cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'finflux')
+
+#(calls, seconds) windows per provider, matching each provider's free tier
+default_rate_limits = {
+    'td': [(8, 60)],
+    'av': [(25, 86400)],
+    'sec': [(10, 1)],
+    'bls': [(50, 10), (500, 86400)],
+    'bea': [(100, 60)],
+    'fred': [(120, 60)],
+}
+
 class Config:
     td_apikey     = None
     av_apikey     = None
@@ -8,6 +22,7 @@ class Config:
     bls_apikey    = None
     email_address = None
     td_baseurl    = 'https://api.twelvedata.com/'
+    td_wsurl      = 'wss://ws.twelvedata.com/v1/quotes/price'
     av_baseurl    = 'https://www.alphavantage.co/query?function='
     cg_baseurl    = 'https://pro-api.coingecko.com/api/v3/'
     fmp_baseurl   = 'https://financialmodelingprep.com/api/'
@@ -15,8 +30,23 @@ class Config:
     fred_baseurl  = 'https://api.stlouisfed.org/fred/'
     sec_baseurl   = 'https://www.sec.gov/'
     bea_baseurl   = 'https://apps.bea.gov/api/data'
+    pool_size     = 10
+    async_workers = 100
+    cache         = True
+    cache_dir     = default_cache_dir
+    cache_size    = 512 * 1024 * 1024
+    rate_limits   = default_rate_limits
+    max_retries   = 3
+    fund_profile_ttl = None
+    price_store   = False
+    max_wait      = 60
 
-def set_config(td=None, av=None, cg=None, fmp=None, fred=None, email=None, bea=None, bls=None):
+def set_config(td=None, av=None, cg=None, fmp=None, fred=None, email=None, bea=None, bls=None, pool_size=10, async_workers=100, cache=True, cache_dir=None, cache_size=512 * 1024 * 1024, rate_limits=None, max_retries=3, fund_profile_ttl=None, price_store=False, max_wait=60):
+    #rate_limits replaces the (calls, seconds) windows of the providers it names and keeps the
+    #free tier defaults for the rest, e.g. for a paid Alpha Vantage key of 75 calls per minute:
+    #   set_config(av='KEY', rate_limits={'av': [(75, 60)]})
+    #an empty list switches pacing off for that provider; a call that would have to wait more
+    #than max_wait seconds for its provider raises RateLimitError (max_wait=None always waits)
     Config.td_apikey     = td
     Config.av_apikey     = av
     Config.cg_apikey     = cg
@@ -25,4 +55,13 @@ def set_config(td=None, av=None, cg=None, fmp=None, fred=None, email=None, bea=N
     Config.email_address = email
     Config.bea_apikey    = bea
     Config.bls_apikey    = bls
-
+    Config.pool_size     = pool_size
+    Config.async_workers = async_workers
+    Config.cache         = cache
+    Config.cache_dir     = cache_dir if cache_dir is not None else default_cache_dir
+    Config.cache_size    = cache_size
+    Config.rate_limits   = {**default_rate_limits, **(rate_limits or {})}
+    Config.max_retries   = max_retries
+    Config.fund_profile_ttl = fund_profile_ttl
+    Config.price_store   = price_store
+    Config.max_wait      = max_wait
@@ -1,10 +1,10 @@
 from finflux.base_var import Config
+from finflux.transport import transport, fan_out
+from finflux.aio import awaitable
+from finflux.lookback import lookback_stats
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
-import matplotlib.pyplot as plt # type: ignore
 from datetime import timedelta, datetime
 
 #------------------------------------------------------------------------------------------
@@ -21,6 +21,7 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class bond:
 #------------------------------------------------------------------------------------------
     def help(self):
@@ -125,7 +126,7 @@ class bond():
         id = FRED_IDs[country]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_bond = requests.get(FRED_url).json()
+        FRED_bond = transport.get(FRED_url).json()
         #----------------------------------------------------------------------------------
 
         def is_numeric(str):
@@ -188,7 +189,7 @@ class bond():
         id = FRED_IDs[maturity]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_yield = requests.get(FRED_url).json()
+        FRED_yield = transport.get(FRED_url).json()
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
@@ -234,17 +235,10 @@ class bond():
             raise MissingConfigObject('Missing fred_apikey. Please set your FRED api key using the set_config() function.')
         
         #RAW DATA/OBSERVATION--------------------------------------------------------------
-        six_m = bond().US_treasury(maturity='6mo', period='6mo')
-        one_y = bond().US_treasury(maturity='1y', period='6mo')
-        two_y = bond().US_treasury(maturity='2y', period='6mo')
-        three_y = bond().US_treasury(maturity='3y', period='6mo')
-        five_y = bond().US_treasury(maturity='5y', period='6mo')
-        seven_y = bond().US_treasury(maturity='7y', period='6mo')
-        ten_y = bond().US_treasury(maturity='10y', period='6mo')
-        twenty_y = bond().US_treasury(maturity='20y', period='6mo')
-        thirty_y = bond().US_treasury(maturity='30y', period='6mo')
-
-        yield_list = [six_m, one_y, two_y, three_y, five_y, seven_y, ten_y, twenty_y, thirty_y]
+        curve_maturities = ['6mo', '1y', '2y', '3y', '5y', '7y', '10y', '20y', '30y']
+
+        #fetching all nine maturities concurrently
+        yield_list = fan_out(lambda maturity: self.US_treasury(maturity=maturity, period='6mo'), curve_maturities)
         #----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
@@ -277,6 +271,9 @@ class bond():
                 three_m_yields.append(curve_data[maturity]['3mo'])
                 eod_yields.append(curve_data[maturity]['eod'])
 
+            #matplotlib is only needed for the graph display, so it is imported on first use
+            import matplotlib.pyplot as plt # type: ignore
+
             fig, ax = plt.subplots()
             ax.plot(maturities, six_m_yields, label='6MO', color='#A7CBE8', linewidth=2.5)
             ax.plot(maturities, three_m_yields, label='3MO', color='#2171B5', linewidth=2.5)
@@ -324,7 +321,7 @@ class bond():
         id = FRED_IDs[maturity]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_yield = requests.get(FRED_url).json()
+        FRED_yield = transport.get(FRED_url).json()
         #----------------------------------------------------------------------------------
 
         def is_numeric(str):
@@ -369,30 +366,22 @@ MATURITY - {eod_data['maturity']}
             raise MissingConfigObject('Missing fred_apikey. Please set your FRED api key using the set_config() function.')
         
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
-        US_timeseries = bond().US_treasury(maturity=maturity, period='10y')
-        
-        US_eod = bond().US_eod(display='json', maturity=maturity)['yield']
-        
-        current_year = pd.Timestamp.now().year
+        US_timeseries = self.US_treasury(maturity=maturity, period='10y')
+
+        #missing FRED observations are carried forward, so holidays never become the reference yield
+        lookback = lookback_stats(US_timeseries.iloc[:, 0])
         #-----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
         quote_data = {
             'identifier': f'US {maturity.upper()} Treasury Bond Yield',
             'ttm': {
-                'high': round(float((US_timeseries.iloc[-252:].max()).iloc[0]),2),
-                'low': round(float((US_timeseries.iloc[-252:].min()).iloc[0]),2)
-            },
-            'percent change': {
-                '5y': float(((US_eod/US_timeseries.iloc[-1260]) - 1).iloc[0] if pd.notna(US_timeseries.iloc[-1260].iloc[0]) else ((US_eod/US_timeseries.iloc[-1260]) - 1).iloc[1]),
-                '1y': float(((US_eod/US_timeseries.iloc[-252]) - 1).iloc[0] if pd.notna(US_timeseries.iloc[-252].iloc[0]) else ((US_eod/US_timeseries.iloc[-252]) - 1).iloc[1]),
-                'ytd': float(((US_eod/US_timeseries[US_timeseries.index.year == current_year].iloc[0]) - 1).iloc[0] if pd.notna(US_timeseries[US_timeseries.index.year == current_year].iloc[0].iloc[0]) else ((US_eod/US_timeseries[US_timeseries.index.year == current_year].iloc[1]) - 1).iloc[0]),
-                '6m': float(((US_eod/US_timeseries.iloc[-126]) - 1).iloc[0] if pd.notna(US_timeseries.iloc[-126].iloc[0]) else ((US_eod/US_timeseries.iloc[-126]) - 1).iloc[1]),
-                '1m': float(((US_eod/US_timeseries.iloc[-21]) - 1).iloc[0] if pd.notna(US_timeseries.iloc[-21].iloc[0]) else ((US_eod/US_timeseries.iloc[-21]) - 1).iloc[1]),
-                '5d': float(((US_eod/US_timeseries.iloc[-5]) - 1).iloc[0] if pd.notna(US_timeseries.iloc[-5].iloc[0]) else ((US_eod/US_timeseries.iloc[-5]) - 1).iloc[1])
+                'high': round(lookback['ttm high'],2),
+                'low': round(lookback['ttm low'],2)
             },
-            '50d average price': float((US_timeseries.iloc[-50:].mean()).iloc[0]),
-            '200d average price': float((US_timeseries.iloc[-200:].mean()).iloc[0])
+            'percent change': lookback['percent change'],
+            '50d average price': lookback['average price']['50d'],
+            '200d average price': lookback['average price']['200d']
         }
 
         #PARAMETER - DISPLAY ===============================================================
@@ -458,7 +447,7 @@ MOVING AVERAGES-------------------------
         id = FRED_IDs[maturity]
 
         FRED_url = f'https://api.stlouisfed.org/fred/series/observations?series_id={id}&api_key={Config.fred_apikey}&file_type=json'
-        FRED_bond = requests.get(FRED_url).json()
+        FRED_bond = transport.get(FRED_url).json()
 
         current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
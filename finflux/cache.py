@@ -0,0 +1,243 @@
+from finflux.base_var import Config
+
+import hashlib
+import json
+import os
+import pickle
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from zoneinfo import ZoneInfo
+
+import requests # type: ignore
+from requests.structures import CaseInsensitiveDict # type: ignore
+
+#------------------------------------------------------------------------------------------
+#query/body parameters that carry credentials and must never become part of a cache key
+SECRET_PARAMS = {'apikey', 'api_key', 'userid', 'registrationkey'}
+
+#response headers that can carry session credentials and are never written to disk
+SECRET_HEADERS = {'set-cookie', 'set-cookie2', 'authorization', 'proxy-authorization'}
+
+EASTERN = ZoneInfo('America/New_York')
+
+#------------------------------------------------------------------------------------------
+def request_key(method: str, url: str, params: dict = None, data=None):
+    scheme, netloc, path, query, _ = urlsplit(url)
+
+    query_items = parse_qsl(query, keep_blank_values=True) + list((params or {}).items())
+    query_items = sorted((k, str(v)) for k, v in query_items if k.lower() not in SECRET_PARAMS)
+    normalized_url = urlunsplit((scheme.lower(), netloc.lower(), path, urlencode(query_items), ''))
+
+    if isinstance(data, (str, bytes)):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            pass
+    if isinstance(data, dict):
+        data = json.dumps({k: v for k, v in data.items() if k.lower() not in SECRET_PARAMS}, sort_keys=True)
+
+    raw_key = f'{method.upper()} {normalized_url} {data if data is not None else ""}'
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+def redact_url(url: str):
+    #the url with credential parameters removed, as stored alongside a cached response
+    scheme, netloc, path, query, fragment = urlsplit(url)
+    query_items = [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if k.lower() not in SECRET_PARAMS]
+    return urlunsplit((scheme, netloc, path, urlencode(query_items), fragment))
+#------------------------------------------------------------------------------------------
+def next_eastern(now: float, hour: int, minute: int):
+    #the next weekday hh:mm US Eastern after 'now', used for the daily/monthly release schedules
+    local = datetime.fromtimestamp(now, EASTERN)
+    candidate = local.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+    while candidate <= local or candidate.weekday() >= 5:
+        candidate = (candidate + timedelta(days=1)).replace(hour=hour, minute=minute)
+
+    return candidate.timestamp()
+
+def expiry(provider: str, url: str, now: float = None):
+    #PER-PROVIDER TTL POLICIES (None means the response is never cached)
+    now = time.time() if now is None else now
+    path = urlsplit(url).path
+
+    if provider == 'sec':
+        #company_tickers.json is kept by the CIK directory, which revalidates it with a conditional GET
+        if path.endswith('company_tickers.json'):
+            return None
+        #the recent submissions block is synced incrementally by the filings store on every call
+        if re.fullmatch(r'/submissions/CIK\d{10}\.json', path):
+            return None
+        return now + 600
+    elif provider == 'fred':
+        #FRED daily series are updated once the H.15 release goes out in the afternoon
+        return next_eastern(now, 16, 30)
+    elif provider in ('bls', 'bea'):
+        #BLS and BEA publish their scheduled releases at 8:30am ET
+        return next_eastern(now, 8, 30)
+    elif provider == 'av':
+        return now + 86400
+    elif provider == 'td':
+        if path.endswith('cryptocurrencies'):
+            return now + 86400
+        return None
+
+    return None
+
+def cacheable(provider: str, response):
+    #some providers report quota/key errors with a 200 status, those must not be cached
+    if response.status_code != 200:
+        return False
+
+    try:
+        body = response.json()
+    except ValueError:
+        return True
+
+    if not isinstance(body, dict):
+        return True
+    if provider == 'bls':
+        return body.get('status') == 'REQUEST_SUCCEEDED'
+    elif provider == 'bea':
+        results = body.get('BEAAPI', {})
+        return 'Error' not in results and 'Error' not in results.get('Results', {})
+    elif provider == 'av':
+        return not any(k in body for k in ('Information', 'Note', 'Error Message'))
+    elif provider == 'td':
+        return body.get('status') != 'error'
+
+    return True
+
+#------------------------------------------------------------------------------------------
+@contextmanager
+def atomic_write(path: str, mode: str = 'w'):
+    #file opened on a temporary sibling of 'path' that replaces it once writing succeeded, so
+    #other threads and processes read either the old file or the new one, never a partial one
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, mode) as file:
+            yield file
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+#------------------------------------------------------------------------------------------
+class DiskCache:
+    #Content-addressed response store: one file per request key, file mtime doubles as the
+    #last-access time so eviction can drop the least recently used entries first.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_dir = None
+#------------------------------------------------------------------------------------------
+    def _path(self, key: str):
+        return os.path.join(Config.cache_dir, key)
+
+    def _load_index(self):
+        if self._index is not None and self._index_dir == Config.cache_dir:
+            return
+
+        os.makedirs(Config.cache_dir, exist_ok=True)
+
+        self._index = {}
+        self._index_dir = Config.cache_dir
+        for entry in os.scandir(Config.cache_dir):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                self._index[entry.name] = (stat.st_size, stat.st_mtime)
+#------------------------------------------------------------------------------------------
+    def get(self, key: str):
+        path = self._path(key)
+
+        try:
+            with open(path, 'rb') as file:
+                entry = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        if entry['expires'] <= time.time():
+            self.delete(key)
+            return None
+
+        #touching the file marks it as recently used
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if self._index is not None and key in self._index:
+                self._index[key] = (self._index[key][0], now)
+
+        response = requests.Response()
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.url = entry['url']
+        response.encoding = entry['encoding']
+        response._content = entry['content']
+        response.from_cache = True
+
+        return response
+
+    def put(self, key: str, response, expires: float):
+        entry = {
+            'expires': expires,
+            'status_code': response.status_code,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in SECRET_HEADERS},
+            'url': redact_url(response.url),
+            'encoding': response.encoding,
+            'content': response.content
+        }
+
+        with self._lock:
+            self._load_index()
+
+            path = self._path(key)
+            with atomic_write(path, 'wb') as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            self._index[key] = (os.path.getsize(path), time.time())
+            self._evict()
+
+    def delete(self, key: str):
+        with self._lock:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            if self._index is not None:
+                self._index.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in list(self._index):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._index = {}
+#------------------------------------------------------------------------------------------
+    def _evict(self):
+        total = sum(size for size, _ in self._index.values())
+        if total <= Config.cache_size:
+            return
+
+        for key, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            del self._index[key]
+
+            total -= size
+            if total <= Config.cache_size:
+                break
+
+#------------------------------------------------------------------------------------------
+disk_cache = DiskCache()
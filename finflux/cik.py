@@ -0,0 +1,128 @@
+from finflux.base_var import Config
+from finflux.transport import transport
+from finflux.cache import atomic_write
+
+import bisect
+import json
+import os
+import threading
+import time
+
+import requests # type: ignore
+
+#------------------------------------------------------------------------------------------
+class cik_directory:
+    #SEC ticker <-> CIK index kept on disk and in memory; the source file is re-checked at most
+    #once a day with a conditional GET, so an unchanged file costs a 304 instead of 1MB+
+    url = 'https://www.sec.gov/files/company_tickers.json'
+    refresh_seconds = 86400
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checked = None
+
+        self._by_ticker = {}
+        self._by_cik = {}
+        self._titles = {}
+        self._sorted_tickers = []
+#------------------------------------------------------------------------------------------
+    def _path(self):
+        #a subdirectory, so the response cache's LRU eviction and clear() never touch it
+        return os.path.join(Config.cache_dir, 'sec', 'company_tickers.json')
+
+    def _read(self):
+        try:
+            with open(self._path(), 'r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, stored: dict):
+        if not Config.cache:
+            return
+
+        with atomic_write(self._path()) as file:
+            json.dump(stored, file)
+
+    def _index(self, data: dict):
+        by_ticker, by_cik, titles = {}, {}, {}
+        for company in data.values():
+            cik = str(company['cik_str']).zfill(10)
+            ticker = company['ticker'].upper()
+
+            by_ticker.setdefault(ticker, cik)
+            by_cik.setdefault(cik, []).append(ticker)
+            titles[cik] = company['title']
+
+        self._by_ticker, self._by_cik, self._titles = by_ticker, by_cik, titles
+        self._sorted_tickers = sorted(by_ticker)
+#------------------------------------------------------------------------------------------
+    def _refresh(self):
+        now = time.time()
+        if self._checked is not None and now - self._checked < cik_directory.refresh_seconds:
+            return
+
+        stored = self._read() if Config.cache else None
+
+        if stored is None or now - stored['checked'] >= cik_directory.refresh_seconds:
+            headers = {'User-Agent': f"{Config.email_address}"}
+            if stored is not None:
+                if stored.get('etag'):
+                    headers['If-None-Match'] = stored['etag']
+                if stored.get('last_modified'):
+                    headers['If-Modified-Since'] = stored['last_modified']
+
+            try:
+                response = transport.get(cik_directory.url, headers=headers)
+            except requests.RequestException:
+                if stored is None:
+                    raise
+                #unreachable SEC: the stored copy is served, the file is re-checked after the next daily window
+                self._index(stored['data'])
+                self._checked = now
+                return
+
+            if response.status_code != 304 and response.ok:
+                stored = {'checked': now,
+                          'etag': response.headers.get('ETag'),
+                          'last_modified': response.headers.get('Last-Modified'),
+                          'data': response.json()}
+            elif stored is None:
+                response.raise_for_status()
+
+            #a 304 (or a failed refresh) keeps serving the stored copy until the next daily check
+            stored['checked'] = now
+            self._write(stored)
+
+        self._index(stored['data'])
+        self._checked = stored['checked']
+
+    def _ensure(self):
+        with self._lock:
+            self._refresh()
+#------------------------------------------------------------------------------------------
+    def cik(self, ticker: str):
+        #10 digit zero padded CIK, or None if the SEC does not list the ticker
+        self._ensure()
+        return self._by_ticker.get(ticker.upper())
+
+    def tickers(self, cik):
+        #reverse lookup: every ticker filed under a CIK (share classes share one CIK)
+        self._ensure()
+        return list(self._by_cik.get(str(cik).zfill(10), []))
+
+    def title(self, cik):
+        self._ensure()
+        return self._titles.get(str(cik).zfill(10))
+
+    def search(self, prefix: str):
+        #{ticker: cik} for every ticker starting with prefix, from a bisect over the sorted tickers
+        self._ensure()
+        prefix = prefix.upper()
+
+        start = bisect.bisect_left(self._sorted_tickers, prefix)
+        end = bisect.bisect_left(self._sorted_tickers, prefix + '\uffff')
+        return {ticker: self._by_ticker[ticker] for ticker in self._sorted_tickers[start:end]}
+
+#------------------------------------------------------------------------------------------
+directory = cik_directory()
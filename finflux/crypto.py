@@ -1,8 +1,13 @@
 from finflux.base_var import Config
+from finflux.transport import transport
+from finflux.aio import awaitable
+from finflux.lookback import lookback_stats
+from finflux.validation import quote_type, quote_types
+from finflux.intraday import download, intraday_intervals
+from finflux.realtime import realtime_prices
 
 import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta
 from typing import Union
@@ -21,6 +26,7 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class crypto: 
     security_type = 'CRYPTOCURRENCY'
 
@@ -30,10 +36,55 @@ class crypto:
 
         self.yfticker = f'{self.from_coin}-USD'
 
-        instrumentType = yf.Ticker(self.yfticker).get_info()['quoteType']
-        if instrumentType != crypto.security_type:
+        #the security type is checked on the first data call rather than at construction
+        self._validated = False
+
+    def _validate(self):
+        if self._validated:
+            return
+
+        if quote_type(self.yfticker) != crypto.security_type:
             raise InvalidSecurityError(f"Invalid security type. "
                                        f"Please select a valid '{crypto.security_type}' symbol")
+        self._validated = True
+
+    @classmethod
+    def validate(cls, tickers: list):
+        #checking many coins with a few batched quote requests: {ticker: is valid coin}
+        yftickers = {ticker: crypto(ticker).yfticker for ticker in tickers}
+        types = quote_types(list(yftickers.values()))
+        return {ticker: types[yfticker] == crypto.security_type for ticker, yfticker in yftickers.items()}
+
+    @classmethod
+    def realtime_many(cls, tickers: list):
+        if Config.td_apikey is None:
+            raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
+
+        coins = {ticker: cls(ticker) for ticker in dict.fromkeys(tickers)}
+
+        invalid = [ticker for ticker, valid in cls.validate(list(coins)).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{crypto.security_type}' symbols")
+
+        #RAW DATA/OBSERVATION--------------------------------------------------------------
+        url_1 = 'https://api.twelvedata.com/cryptocurrencies'
+        td_crypto_list = {i['symbol'] for i in transport.get(url_1).json()['data']}
+
+        #pairs Twelve Data quotes directly, otherwise the coin/USD and USD/currency legs
+        legs = {}
+        for ticker, coin in coins.items():
+            if f'{coin.from_coin}/{coin.to_cc}' in td_crypto_list:
+                legs[ticker] = [f'{coin.from_coin}/{coin.to_cc}']
+            else:
+                legs[ticker] = [f'{coin.from_coin}/USD', f'USD/{coin.to_cc}']
+
+        td_prices = realtime_prices([symbol for symbols in legs.values() for symbol in symbols])
+        #----------------------------------------------------------------------------------
+
+        output = {ticker: {'symbol': ticker,
+                           'price': float(np.prod([td_prices[symbol] for symbol in legs[ticker]]))} for ticker in coins}
+        return output
 #------------------------------------------------------------------------------------------
     def help(self):
         output = '''
@@ -42,7 +93,7 @@ class crypto():
  |      period      :str        =5y         [1y, 2y, 5y, 10y, max]
  |      start       :str        =None       [YYYY-MM-DD*]
  |      end         :str        =None       [YYYY-MM-DD*]
- |      interval    :str        =1d         [1d, 1wk, 1mo, 3mo]
+ |      interval    :str        =1d         [1m, 5m, 15m, 1h, 1d, 1wk, 1mo, 3mo]
  |      data        :str        =all        [open, high, low, close, all]
  |      calculation :str        =price      [price, simple return, log return]
  |      round       :bool       =True       [True, False]
@@ -51,6 +102,10 @@ class crypto():
  |  realtime()--------------Coin realtime exchange rate
  |      display     :str        =json       [json, pretty]
  |      -----api(s): twelve data
+ |
+ |  realtime_many()---------Realtime exchange rates for many coins in batched requests (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      -----api(s): twelve data
  |      
  |  conversion()------------Coin currency conversion calculator
  |      display     :str        =json       [json, pretty]
@@ -71,7 +126,7 @@ class crypto():
 #------------------------------------------------------------------------------------------
     def timeseries(self, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True): 
         valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
-                        'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
+                        'valid_interval' : ['1m', '5m', '15m', '1h', '1d', '1wk', '1mo', '3mo'],
                         'valid_data' : ['open', 'high', 'low', 'close', 'all'],
                         'valid_calculation' : ['price', 'simple return', 'log return'],
                         'valid_round' : [True, False]}
@@ -87,8 +142,10 @@ class crypto():
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATION--------------------------------------------------------------
-        timeseries_data = yf.download(f'{self.from_coin}-USD', period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False)
+        timeseries_data = download(f'{self.from_coin}-USD', period=period, start=start, end=end, interval=interval, round=round)
         #----------------------------------------------------------------------------------
         
         forex_start = str(timeseries_data.index[0] + timedelta(days=-5))[0:10]
@@ -97,13 +154,17 @@ class crypto():
         if self.to_cc == 'USD':
             timeseries_data = timeseries_data
         if self.to_cc != 'USD':
-            other_timeseries_data = yf.download(f'{self.from_coin}-{self.to_cc}', period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=True, group_by='column', progress=False)
+            other_timeseries_data = download(f'{self.from_coin}-{self.to_cc}', period=period, start=start, end=end, interval=interval, round=True)
             
             if not other_timeseries_data.empty:
                 timeseries_data = other_timeseries_data
 
             elif other_timeseries_data.empty:
-                yf_forex_timeseries = yf.download(f'{self.to_cc}=X', progress=False, start=forex_start, end=forex_end)['Close']
+                if interval in intraday_intervals:
+                    #intraday rates up to now, so the last coin bars are not left without a rate
+                    yf_forex_timeseries = download(f'{self.to_cc}=X', start=forex_start, interval=interval, round=False)['Close']
+                else:
+                    yf_forex_timeseries = yf.download(f'{self.to_cc}=X', progress=False, start=forex_start, end=forex_end)['Close']
 
                 missing_index = yf_forex_timeseries.index.difference(timeseries_data.index)
 
@@ -160,9 +221,11 @@ class crypto():
         if Config.td_apikey is None:
             raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')    
        
+        self._validate()
+
         #RAW DATA/OBSERVATION--------------------------------------------------------------
         url_1 = 'https://api.twelvedata.com/cryptocurrencies'
-        td_crypto_json = requests.get(url_1).json()['data']
+        td_crypto_json = transport.get(url_1).json()['data']
 
         td_crypto_list = []
         for i in td_crypto_json:
@@ -172,15 +235,15 @@ class crypto():
         #retriving coin exchange rate if directly avaliable
         if f'{self.from_coin}/{self.to_cc}' in td_crypto_list:
             url_2 = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={self.from_coin}/{self.to_cc}'
-            td_realtime = float(requests.get(url_2).json()['price'])
+            td_realtime = float(transport.get(url_2).json()['price'])
 
         #calculating coin exchange rate by passing through USD rates
         elif f'{self.from_coin}/{self.to_cc}' not in td_crypto_list:
             url_2 = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={self.from_coin}/USD'
-            td_realtime_coinusd = float(requests.get(url_2).json()['price'])
+            td_realtime_coinusd = float(transport.get(url_2).json()['price'])
 
             url_3 = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol=USD/{self.to_cc}'
-            td_realtime_usdcc = float(requests.get(url_3).json()['price'])
+            td_realtime_usdcc = float(transport.get(url_3).json()['price'])
 
             td_realtime = td_realtime_coinusd * td_realtime_usdcc
         #----------------------------------------------------------------------------------
@@ -212,11 +275,13 @@ Exchange Rate: {realtime_data['price']:2f}
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #PARAMETER - RATE =================================================================
         if rate == 'realtime':
             conversion_rate = float(self.realtime()['price'])
         elif rate == 'eod':
-            conversion_rate = round(crypto(self.ticker).timeseries()['Close'].iloc[-1].iloc[0],2)
+            conversion_rate = round(self.timeseries()['Close'].iloc[-1].iloc[0],2)
         else:
             conversion_rate = rate
 
@@ -252,14 +317,18 @@ Post-conversion: {round(data['post-conversion'],2)}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_download = crypto(self.ticker).timeseries(period='max')
+        quote_start = str((pd.Timestamp.now() - pd.DateOffset(years=5, months=2)).date())
+
+        yf_download = self.timeseries(start=quote_start)
 
         yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
 
-        yf_eod = yf_download['Close'].iloc[-1].iloc[0]
+        #the timeseries frame has a single (field, pair) column under each field
+        lookback = lookback_stats(yf_download['Close'].iloc[:, 0], yf_download['High'].iloc[:, 0], yf_download['Low'].iloc[:, 0])
 
-        current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
@@ -276,19 +345,12 @@ Post-conversion: {round(data['post-conversion'],2)}'''
                 'close': float((yf_download['Close'].iloc[-1]).iloc[0])
             },
             'ttm': {
-                'high': round(float((yf_download['High'].iloc[-252:].max()).iloc[0]),2),
-                'low': round(float((yf_download['Low'].iloc[-252:].min()).iloc[0]),2)
-            },
-            'percent change': {
-                '5y': float(((yf_eod/yf_download['Close'].iloc[-1260]) - 1).iloc[0]) if yf_download.shape[0]>1260 else np.nan,
-                '1y': float(((yf_eod/yf_download['Close'].iloc[-252]) - 1).iloc[0]) if yf_download.shape[0]>252 else np.nan,
-                'ytd': float(((yf_eod/yf_download['Close'][yf_download.index.year == current_year].iloc[0]) - 1).iloc[0]),
-                '6m': float(((yf_eod/yf_download['Close'].iloc[-126]) - 1).iloc[0]) if yf_download.shape[0]>126 else np.nan,
-                '1m': float(((yf_eod/yf_download['Close'].iloc[-21]) - 1).iloc[0]) if yf_download.shape[0]>21 else np.nan,
-                '5d': float(((yf_eod/yf_download['Close'].iloc[-5]) - 1).iloc[0]) if yf_download.shape[0]>5 else np.nan
+                'high': round(lookback['ttm high'],2),
+                'low': round(lookback['ttm low'],2)
             },
-            '50d average price': float((yf_download['Close'].iloc[-50:].mean()).iloc[0]),
-            '200d average price': float((yf_download['Close'].iloc[-200:].mean()).iloc[0])
+            'percent change': lookback['percent change'],
+            '50d average price': lookback['average price']['50d'],
+            '200d average price': lookback['average price']['200d']
         }
 
         #PARAMETER - DISPLAY ==============================================================
@@ -331,6 +393,8 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS---------------------------------------------------------
         news = yf.Ticker(self.ticker).get_news()
         #------------------------------------------------------------------------------
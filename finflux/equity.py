@@ -1,8 +1,19 @@
 from finflux.base_var import Config
+from finflux.transport import transport, fan_out
+from finflux.aio import awaitable
+from finflux.cik import directory
+from finflux.filings import sec_filings
+from finflux.profiles import profiles
+from finflux.intraday import download
+from finflux.realtime import realtime_prices, realtime_currencies
+from finflux.lookback import lookback_stats
+from finflux.resolver import price_resolver
+from finflux.snapshot import financial_snapshot
+from finflux.render import render
+from finflux.validation import quote_type, quote_types
 
 import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from datetime import timedelta
 
@@ -20,17 +31,171 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class equity:
     security_type = 'EQUITY'
+    download_chunk = 100
 
     def __init__(self,ticker):
         self.ticker = ticker
         self.mticker = ticker.split('.')[0]
 
-        instrumentType = yf.Ticker(self.ticker).get_history_metadata()['instrumentType']
-        if instrumentType != equity.security_type:
+        #the security type is checked on the first data call rather than at construction
+        self._validated = False
+
+        #statements and info, fetched once per instance on first use
+        self._financials = financial_snapshot(ticker)
+
+    def _validate(self):
+        if self._validated:
+            return
+
+        if quote_type(self.ticker) != equity.security_type:
             raise InvalidSecurityError(f"Invalid security type. "
                                     f"Please select a valid '{equity.security_type}' symbol")
+        self._validated = True
+
+    @classmethod
+    def validate(cls, tickers: list):
+        #checking many symbols with a few batched quote requests: {ticker: is valid equity}
+        types = quote_types(tickers)
+        return {ticker: types[ticker] == equity.security_type for ticker in tickers}
+
+    @classmethod
+    def timeseries_many(cls, tickers: list, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True, layout: str = 'wide'):
+        valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
+                        'valid_interval' : ['1m', '5m', '15m', '1h', '1d', '1wk', '1mo', '3mo'],
+                        'valid_data' : ['open', 'high', 'low', 'close', 'volume', 'all'],
+                        'valid_calculation' : ['price', 'simple return', 'log return'],
+                        'valid_round' : [True, False],
+                        'valid_layout' : ['wide', 'long']}
+        
+        params = {'period': period,
+                  'interval': interval,
+                  'data': data,
+                  'calculation': calculation,
+                  'round': round,
+                  'layout': layout}
+        
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        tickers = list(dict.fromkeys(tickers))
+
+        invalid = [ticker for ticker, valid in cls.validate(tickers).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{equity.security_type}' symbols")
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #one threaded multi-symbol download per chunk, joined into a (price field, ticker) column panel
+        chunks = [tickers[i:i + equity.download_chunk] for i in range(0, len(tickers), equity.download_chunk)]
+        yf_download = pd.concat([download(chunk, period=period, start=start, end=end, interval=interval, round=round) for chunk in chunks], axis=1)
+        #----------------------------------------------------------------------------------
+
+        #PARAMETER - DATA =================================================================
+        if data == 'all':
+            yf_download = yf_download[['Open', 'High', 'Low', 'Close', 'Volume']]
+        else:
+            yf_download = yf_download[[data.capitalize()]]
+
+        #PARAMETER - CALCULATION ==========================================================
+        #applied to the whole panel at once rather than ticker by ticker
+        if calculation == 'price':
+            output = yf_download
+        elif calculation == 'simple return':
+            output = (yf_download / yf_download.shift(1))-1
+            if round == True:
+                output = output.round(2)
+        elif calculation == 'log return':
+            output = np.log(yf_download / yf_download.shift(1))
+            if round == True:
+                output = output.round(2)
+
+        #PARAMETER - LAYOUT ===============================================================
+        if layout == 'wide':
+            output = output if data == 'all' else output[data.capitalize()]
+        elif layout == 'long':
+            output = output.stack(level=1, future_stack=True).rename_axis(['Date', 'Ticker']).dropna(how='all')
+
+        return output
+
+    @classmethod
+    def realtime_many(cls, tickers: list):
+        if Config.td_apikey is None:
+            raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
+
+        tickers = list(dict.fromkeys(tickers))
+
+        invalid = [ticker for ticker, valid in cls.validate(tickers).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{equity.security_type}' symbols")
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #prices in batches of up to 120 symbols per request, currencies from the cache
+        mtickers = {ticker: ticker.split('.')[0] for ticker in tickers}
+        td_prices = realtime_prices(list(mtickers.values()))
+        td_quote_currencies = realtime_currencies(list(mtickers.values()))
+        #----------------------------------------------------------------------------------
+
+        output = {ticker: {'symbol': ticker,
+                           'price': td_prices[mticker],
+                           'currency': td_quote_currencies[mticker]} for ticker, mticker in mtickers.items()}
+        return output
+
+    @classmethod
+    def statement_panel(cls, tickers: list, statement: str = 'all', interval: str = 'annual', unit: str = 'raw', currency: str = None, layout: str = 'frame'):
+        valid_params = {'valid_statement' : ['income', 'balance', 'cash', 'all'],
+                        'valid_interval' : ['annual', 'quarter'],
+                        'valid_unit' : ['thousand', 'million', 'billion', 'raw'],
+                        'valid_layout' : ['frame', 'cube']}
+        
+        params = {'statement': statement,
+                  'interval': interval,
+                  'unit': unit,
+                  'layout': layout}
+        
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        tickers = list(dict.fromkeys(tickers))
+
+        invalid = [ticker for ticker, valid in cls.validate(tickers).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{equity.security_type}' symbols")
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #every name goes through the same statement_items/renamed_items mapping, so line items line up
+        frames = fan_out(lambda ticker: cls(ticker)._statement_frame(statement=statement, currency=currency, unit=unit, interval=interval), tickers)
+        #----------------------------------------------------------------------------------
+
+        #a restated or shifted fiscal year-end can repeat a period label, the latest one is kept
+        frames = [frame.loc[~frame.index.duplicated(), ~frame.columns.duplicated()] for frame in frames]
+
+        #every name is reindexed to the union of line items and periods, so a missing item or
+        #period is NaN in its own cell instead of shifting the rows of the names after it
+        items = list(dict.fromkeys(item for frame in frames for item in frame.index))
+        periods = sorted({period for frame in frames for period in frame.columns}, reverse=True)
+
+        #(ticker, line item) rows by period columns, latest period first
+        panel = pd.concat([frame.reindex(index=items, columns=periods) for frame in frames], keys=tickers, names=['Ticker', 'Line Item'])
+
+        #PARAMETER - LAYOUT ===============================================================
+        if layout == 'frame':
+            output = panel
+        elif layout == 'cube':
+            output = {'data': panel.to_numpy(dtype=float).reshape(len(tickers), len(items), len(periods)),
+                      'tickers': tickers,
+                      'items': items,
+                      'periods': periods}
+
+        return output
 #------------------------------------------------------------------------------------------
     def help(self):
         output = '''
@@ -39,18 +204,43 @@ class equity():
  |      period      :str        =5y         [1mo, 6mo, 1y, 2y, 5y, 10y, ytd, max]
  |      start       :str        =None       [YYYY-MM-DD*]
  |      end         :str        =None       [YYYY-MM-DD*]
- |      interval    :str        =1d         [1d, 1wk, 1mo, 3mo]
+ |      interval    :str        =1d         [1m, 5m, 15m, 1h, 1d, 1wk, 1mo, 3mo]
+ |      data        :str        =all        [open, high, low, close, volume, all]
+ |      calculation :str        =price      [price, simple return, log return]
+ |      round       :bool       =True       [True, False]
+ |      -----api(s): yfinance
+ |
+ |  timeseries_many()-------OHLCV price panel for many stocks (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      period      :str        =5y         [1mo, 6mo, 1y, 2y, 5y, 10y, ytd, max]
+ |      start       :str        =None       [YYYY-MM-DD*]
+ |      end         :str        =None       [YYYY-MM-DD*]
+ |      interval    :str        =1d         [1m, 5m, 15m, 1h, 1d, 1wk, 1mo, 3mo]
  |      data        :str        =all        [open, high, low, close, volume, all]
  |      calculation :str        =price      [price, simple return, log return]
  |      round       :bool       =True       [True, False]
+ |      layout      :str        =wide       [wide, long]
  |      -----api(s): yfinance
  |
+ |  statement_panel()-------IS, BS, CFS line items for many stocks (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      statement   :str        =all        [income, balance, cash, all]
+ |      interval    :str        =annual     [annual, quarter]
+ |      unit        :str        =raw        [thousand, million, billion, raw]
+ |      currency    :str        =None       [CCC*]
+ |      layout      :str        =frame      [frame, cube]
+ |      -----api(s): yfinance, twelve data
+ |
  |  realtime()--------------Realtime stock price
  |      display     :str        =json       [json, pretty]
  |      -----api(s): twelve data
+ |
+ |  realtime_many()---------Realtime prices for many stocks in batched requests (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      -----api(s): twelve data
  |  
  |  statement()-------------IS, BS, CFS data
- |      display     :str        =json       [json, table]
+ |      display     :str        =json       [json, table, frame]
  |      statement   :str        =all        [income, balance, cash, all]
  |      currency    :str        =None       [CCC*]
  |      unit        :str        =raw        [thousand, million, billion, raw]
@@ -70,12 +260,13 @@ class equity():
  |      display     :str        =json       [json, pretty]
  |      -----api(s): yfinance
  |  
- |  filings()---------------Recent SEC filings within at least one year of filing or to 1,000 filings (whichever is more)
+ |  filings()---------------SEC filing history, synced incrementally (only new accession numbers are added)
  |      form        :str        =None       [FORM*]
+ |      new         :bool       =False      [True, False]
  |      -----api(s): SEC
  |  
  |  eps()-------------------EPS timeseries
- |      display     :str        =json       [json, table]
+ |      display     :str        =json       [json, table, frame]
  |      interval    :str        =annual     [quarter, annual]
  |      -----api(s): alpha vantage
  |  
@@ -84,7 +275,7 @@ class equity():
  |      -----api(s): yfinance
  |  
  |  dividend()--------------Dividend timeseries
- |      display     :str        =json       [json, table]
+ |      display     :str        =json       [json, table, frame]
  |      -----api(s): yfinance
  |  
  |  split()-----------------Stock split timeseries
@@ -106,7 +297,7 @@ class equity():
     def timeseries(self, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True):
         #Checking if the parameter inputs are invalid
         valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
-                        'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
+                        'valid_interval' : ['1m', '5m', '15m', '1h', '1d', '1wk', '1mo', '3mo'],
                         'valid_data' : ['open', 'high', 'low', 'close', 'volume', 'all'],
                         'valid_calculation' : ['price', 'simple return', 'log return'],
                         'valid_round' : [True, False]}
@@ -122,10 +313,12 @@ class equity():
             if param_value not in valid_param:
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #Downloading the raw price data timeseries from yahoo finance with some presets'''
         #Note: The start, end parameters override the period parameter
-        yf_download = yf.download(self.ticker, period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False)
+        yf_download = download(self.ticker, period=period, start=start, end=end, interval=interval, round=round)
         #----------------------------------------------------------------------------------
 
         #PARAMETER - DATA =================================================================
@@ -161,12 +354,13 @@ class equity():
         if Config.td_apikey is None:
             raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         url_1 = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={self.mticker}'
-        td_realtime = requests.get(url_1).json()
+        td_realtime = transport.get(url_1).json()
 
-        url_2 = Config.td_baseurl + f'quote?apikey={Config.td_apikey}&symbol={self.mticker}'
-        td_quote = requests.get(url_2).json()
+        td_quote = {'currency': realtime_currencies([self.mticker])[self.mticker]}
         #----------------------------------------------------------------------------------
         
         #PARAMETER - DISPLAY ==============================================================
@@ -185,7 +379,7 @@ Currency: {td_quote['currency']}'''
     def statement(self, display: str = 'json', statement: str = 'all', currency: str = None, unit: str = 'raw', decimal: bool = False, interval: str = 'annual'): 
         valid_params = {'valid_statement' : ['income', 'balance', 'cash', 'all'],
                         'valid_unit' : ['thousand', 'million', 'billion', 'raw'],
-                        'valid_display' : ['json', 'table'],
+                        'valid_display' : ['json', 'table', 'frame'],
                         'valid_decimal' : [True, False],
                         'valid_interval' : ['annual', 'quarter']}
         
@@ -200,8 +394,30 @@ Currency: {td_quote['currency']}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
+        data = self._statement_frame(statement=statement, currency=currency, unit=unit, interval=interval)
+
+        #PARAMETER - DECIMAL ===============================================================
+        if decimal == False:
+            data = data.round().astype('Int64')
+
+        #PARAMETER - DISPLAY ===============================================================
+        if display == 'frame':
+            output = data
+            return output
+        elif display == 'json':
+            output = data.to_dict() if decimal == True else data.astype(object).where(data.notna(), 'nan').to_dict()
+            return output
+        elif display == 'table':
+            output = render(data, '{:,}', missing=np.nan) if decimal == True else render(data, '{:,.0f}')
+            return output    
+#------------------------------------------------------------------------------------------
+    def _statement_frame(self, statement: str = 'all', currency: str = None, unit: str = 'raw', interval: str = 'annual'):
+        #numeric statement data shared by statement() and stats(); display formatting is left to the caller
+
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
-        firm = yf.Ticker(self.ticker)
+        financials = self._financials
 
         #STATEMENT ITEMS
         statement_items = {
@@ -315,9 +531,9 @@ Currency: {td_quote['currency']}'''
         #PARAMETER - INTERVAL ==============================================================
         def Income():
             if interval == 'annual':
-                IS = firm.income_stmt.iloc[:, 0:4]
+                IS = financials.statement('income').iloc[:, 0:4]
             elif interval == 'quarter':
-                IS = firm.quarterly_income_stmt.iloc[:, 0:5]
+                IS = financials.statement('income', interval='quarter').iloc[:, 0:5]
 
                     #creating new IS line item
             IS.loc['Other Operating Expenses'] = (
@@ -336,9 +552,9 @@ Currency: {td_quote['currency']}'''
         
         def Balance():
             if interval == 'annual':
-                BS = firm.balance_sheet.iloc[:, 0:4]
+                BS = financials.statement('balance').iloc[:, 0:4]
             elif interval == 'quarter':
-                BS = firm.quarterly_balance_sheet.iloc[:, 0:5]
+                BS = financials.statement('balance', interval='quarter').iloc[:, 0:5]
 
             BS.loc['Other Current Assets'] = (
                 (BS.loc['Current Assets'] if 'Current Assets' in BS.index else np.nan)
@@ -373,9 +589,9 @@ Currency: {td_quote['currency']}'''
 
         def Cash():
             if interval == 'annual':
-                CF = firm.cash_flow.iloc[:, 0:4]
+                CF = financials.statement('cash').iloc[:, 0:4]
             elif interval == 'quarter':
-                CF = firm.quarterly_cash_flow.iloc[:, 0:5]
+                CF = financials.statement('cash', interval='quarter').iloc[:, 0:5]
 
             CF.loc['Other Operating Cash Flow'] = (
                 (CF.loc['Operating Cash Flow'] if 'Operating Cash Flow' in CF.index else np.nan)
@@ -441,7 +657,7 @@ Currency: {td_quote['currency']}'''
             data /= 1000000000
 
         #PARAMETER - CURRENCY ==============================================================
-        current_currency = firm.get_info()['financialCurrency'] if 'financialCurrency' in firm.get_info().keys() else '---'
+        current_currency = financials.info().get('financialCurrency', '---')
         
         if currency == current_currency or currency == '---':
             None
@@ -451,15 +667,10 @@ Currency: {td_quote['currency']}'''
             
             forex_pair = f'{current_currency}/{currency}'
             url = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={forex_pair}'
-            exchange_rate = requests.get(url).json()['price']
+            exchange_rate = transport.get(url).json()['price']
             
             data *= float(exchange_rate)
             
-        #PARAMETER - DECIMAL ===============================================================
-        if decimal == False:
-            data = data.map(lambda x: str(x) if pd.isna(x) else x)
-            data = data.map(lambda x: int('{:.0f}'.format(x)) if isinstance(x, float) else x)
-
         #COLUMN RENAMING
         if interval == 'annual':
             data.columns = [f'FY {str(col)[:4]}' for col in data.columns]
@@ -467,13 +678,7 @@ Currency: {td_quote['currency']}'''
         elif interval == 'quarter':
             data.columns = [f'{str(col)[:7]}' for col in data.columns]
 
-        #PARAMETER - DISPLAY ===============================================================
-        if display == 'json':
-            output = data.to_dict()
-            return output
-        elif display == 'table':
-            output = data.map(lambda x: f'{x:,}' if isinstance(x, (int, float)) and pd.notna(x) else x)
-            return output    
+        return data
 #------------------------------------------------------------------------------------------
     def quote(self, display: str = 'json'):
         valid_params = {'valid_display': ['json', 'pretty'],}
@@ -485,16 +690,24 @@ Currency: {td_quote['currency']}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
-        yf_download = yf.download(self.ticker, progress=False)
-        
-        yf_quote = yf.Ticker(self.ticker).get_fast_info()
+        #a bounded window covering the longest lookback (5y percent change) plus a buffer
+        quote_start = str((pd.Timestamp.now() - pd.DateOffset(years=5, months=2)).date())
 
-        yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
+        yf_ticker = yf.Ticker(self.ticker)
+
+        yf_download = yf_ticker.history(start=quote_start)
 
-        yf_eod = yf.download(self.ticker, progress=False)['Close'].iloc[-1].iloc[0]
+        yf_quote = yf_ticker.get_fast_info()
+
+        yf_history_metadata = yf_ticker.get_history_metadata()
+
+        lookback = lookback_stats(yf_download['Close'], yf_download['High'], yf_download['Low'], yf_download['Volume'])
+
+        yf_eod = lookback['eod']
 
-        current_year = pd.Timestamp.now().year
         #-----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
@@ -506,28 +719,21 @@ Currency: {td_quote['currency']}'''
             'timezone': yf_history_metadata.get('timezone','-'),
             'last trading day': {
                 'date': str(yf_download.index[-1].date()),
-                'open': float((yf_download['Open'].iloc[-1]).iloc[0]),
-                'high': float((yf_download['High'].iloc[-1]).iloc[0]),
-                'low': float((yf_download['Low'].iloc[-1]).iloc[0]),
-                'close': float((yf_download['Close'].iloc[-1]).iloc[0]),
-                'volume': int((yf_download['Volume'].iloc[-1]).iloc[0])
+                'open': float(yf_download['Open'].iloc[-1]),
+                'high': float(yf_download['High'].iloc[-1]),
+                'low': float(yf_download['Low'].iloc[-1]),
+                'close': float(yf_download['Close'].iloc[-1]),
+                'volume': int(yf_download['Volume'].iloc[-1])
             },
             'ttm': {
-                'high': round(float((yf_download['High'].iloc[-252:].max()).iloc[0]),2),
-                'low': round(float((yf_download['Low'].iloc[-252:].min()).iloc[0]),2)
+                'high': round(lookback['ttm high'],2),
+                'low': round(lookback['ttm low'],2)
             },
-            'percent change': {
-                '5y': float(((yf_eod/yf_download['Close'].iloc[-1260]) - 1).iloc[0]) if yf_download.shape[0]>1260 else np.nan,
-                '1y': float(((yf_eod/yf_download['Close'].iloc[-252]) - 1).iloc[0]) if yf_download.shape[0]>252 else np.nan,
-                'ytd': float(((yf_eod/yf_download['Close'][yf_download.index.year == current_year].iloc[0]) - 1).iloc[0]),
-                '6m': float(((yf_eod/yf_download['Close'].iloc[-126]) - 1).iloc[0]) if yf_download.shape[0]>126 else np.nan,
-                '1m': float(((yf_eod/yf_download['Close'].iloc[-21]) - 1).iloc[0]) if yf_download.shape[0]>21 else np.nan,
-                '5d': float(((yf_eod/yf_download['Close'].iloc[-5]) - 1).iloc[0]) if yf_download.shape[0]>5 else np.nan
-            },
-            '50d average price': float((yf_download['Close'].iloc[-50:].mean()).iloc[0]),
-            '200d average price': float((yf_download['Close'].iloc[-200:].mean()).iloc[0]),
-            '10d average volume': int((yf_download['Volume'].iloc[-10:].mean()).iloc[0]),
-            '90d average volume': int((yf_download['Volume'].iloc[-90:].mean()).iloc[0]),
+            'percent change': lookback['percent change'],
+            '50d average price': lookback['average price']['50d'],
+            '200d average price': lookback['average price']['200d'],
+            '10d average volume': int(lookback['average volume']['10d']),
+            '90d average volume': int(lookback['average volume']['90d']),
             'shares outstanding': int(yf_quote['shares']),
             'market cap': int(yf_quote.get('shares', np.nan) * yf_eod)
         }
@@ -578,10 +784,12 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS--------------------------------------------------------------
         yf_history_metadata = yf.Ticker(self.ticker).get_history_metadata()
 
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self._financials.info()
 
         yf_calendar = yf.Ticker(self.ticker).get_calendar()
 
@@ -589,19 +797,7 @@ MOVING AVERAGES-------------------------
         if Config.email_address is None:
                 raise MissingConfigObject('Missing email_address. Please set your email address using the set_config() function.')
 
-        sec_header = {'User-Agent': f"{Config.email_address}"}
-        sec_list = requests.get("https://www.sec.gov/files/company_tickers.json", headers=sec_header).json()
-
-        companyData = pd.DataFrame.from_dict(sec_list, orient='index')
-
-        companyData['cik_str'] = companyData['cik_str'].astype(str).str.zfill(10)
-
-        try:
-            index_of_ticker = int(companyData[companyData['ticker'] == self.ticker].index[0])
-
-            sec_cik = companyData.iloc[index_of_ticker,0]
-        except IndexError:
-            sec_cik = '-'
+        sec_cik = directory.cik(self.ticker) or '-'
         #-----------------------------------------------------------------------------------
 
         #COMPANY OFFICERS
@@ -676,6 +872,8 @@ COMPANY OFFICERS--------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         news = yf.Ticker(self.ticker).get_news()
         #----------------------------------------------------------------------------------
@@ -714,28 +912,32 @@ URL: {i['url']}
 
             print(output)
 #------------------------------------------------------------------------------------------
-    def filings(self, form: str = None): 
-        
-        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        headers = {'User-Agent': f"{Config.email_address}"}
-        companyTickers = requests.get("https://www.sec.gov/files/company_tickers.json", headers=headers) #ticker-cik json data request
-        
-        companyData = pd.DataFrame.from_dict(companyTickers.json(), orient='index')
-        companyData['cik_str'] = companyData['cik_str'].astype(str).str.zfill(10) # adding leading zeros to cik
-
-        index_of_ticker = int(companyData[companyData['ticker'] == self.ticker].index[0]) #finding the row with the desired ticker
+    def filings(self, form: str = None, new: bool = False): 
+        valid_params = {'valid_new': [True, False]}
 
-        sec_cik = companyData.iloc[index_of_ticker,0] #retriving the cik id of the ticker
+        params = {'new': new}
 
-        filingMetadata = requests.get(f'https://data.sec.gov/submissions/CIK{sec_cik}.json', headers=headers) #requesting raw json filing data
-        #----------------------------------------------------------------------------------
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(str(x) for x in valid_param)}")
+        
+        self._validate()
 
-        #DATAFRAME ORGANIZATION
-        allForms = pd.DataFrame.from_dict(filingMetadata.json()['filings']['recent'])
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        sec_cik = directory.cik(self.ticker) #retriving the cik id of the ticker from the local SEC directory
+        if sec_cik is None:
+            raise InvalidSecurityError(f"No SEC CIK found for '{self.ticker}'. "
+                                       f"Please select a symbol that files with the SEC")
 
-        allForms = allForms[['accessionNumber','filingDate','form']]
+        new_filings = sec_filings.sync(sec_cik) #adding filings not seen before (full history on the first sync)
+        #----------------------------------------------------------------------------------
 
-        allForms = allForms.set_index('accessionNumber')
+        #PARAMETER - NEW ==================================================================
+        if new == True:
+            allForms = sec_filings.frame(sec_cik, new_filings)
+        else:
+            allForms = sec_filings.frame(sec_cik)
 
         #PARAMETER - FORM =================================================================
         if form != None:
@@ -745,7 +947,7 @@ URL: {i['url']}
 #------------------------------------------------------------------------------------------
     def eps(self, display: str = 'json', interval: str = 'annual'): 
         valid_params = {'valid_interval': ['quarter', 'annual'],
-                        'valid_display': ['json', 'table']}
+                        'valid_display': ['json', 'table', 'frame']}
         
         params = {'interval': interval,
                   'display': display}
@@ -758,9 +960,11 @@ URL: {i['url']}
         if Config.av_apikey is None:
                 raise MissingConfigObject('Missing av_apikey. Please set your Alpha Vantage api key using the set_config() function.')
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------        
         url = f'{Config.av_baseurl}EARNINGS&apikey={Config.av_apikey}&symbol={self.mticker}'
-        av_eps = requests.get(url).json()
+        av_eps = transport.get(url).json()
         #----------------------------------------------------------------------------------
 
         #PARAMETER - INTERVAL =============================================================
@@ -773,7 +977,6 @@ URL: {i['url']}
           
             #json to df of annual eps
             table_eps_data = pd.DataFrame.from_dict(json_eps_data, orient='index', columns=['Reported EPS']).astype(float)
-            table_eps_data = table_eps_data.map(lambda x: f'{x:.2f}' if isinstance(x, (int, float)) else x)
             table_eps_data.index = pd.to_datetime(table_eps_data.index)
 
         elif interval == 'quarter':
@@ -789,8 +992,8 @@ URL: {i['url']}
                 }
 
             #json to df of quarterly eps
-            table_eps_data = pd.DataFrame.from_dict(json_eps_data, orient='index')
-            table_eps_data = table_eps_data.map(lambda x: f'{x:.2f}' if isinstance(x, (int, float)) else x)
+            #missing estimates ('-' in the json output) become NaN so every column stays float64
+            table_eps_data = pd.DataFrame.from_dict(json_eps_data, orient='index').apply(pd.to_numeric, errors='coerce')
             table_eps_data = table_eps_data.rename(columns={'reported eps': 'Reported EPS',
                                                             'estimated eps': 'Estimated EPS',
                                                             'surprise': 'Surprise',
@@ -799,12 +1002,16 @@ URL: {i['url']}
             table_eps_data.index = pd.to_datetime(table_eps_data.index)
 
         #PARAMETER - DISPLAY ==============================================================
-        if display == 'json':
+        if display == 'frame':
+            output = table_eps_data
+            return output
+
+        elif display == 'json':
             output = json_eps_data
             return output
         
         elif display == 'table':
-            output = table_eps_data
+            output = render(table_eps_data, '{:.2f}', missing='-')
             return output
 #------------------------------------------------------------------------------------------
     def analyst_estimates(self, display: str = 'json'): 
@@ -817,8 +1024,10 @@ URL: {i['url']}
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
             
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        firm = yf.Ticker(self.ticker)
+        firm = self._financials.firm
 
         yf_calendar = firm.get_calendar()
         yf_earnings_estimate = firm.get_earnings_estimate()
@@ -828,7 +1037,7 @@ URL: {i['url']}
 
         yf_history_metadata = firm.get_history_metadata()
 
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self._financials.info()
         #----------------------------------------------------------------------------------
 
         #renaming a json format EARNINGS estimate data
@@ -933,7 +1142,7 @@ PRICE ESTIMATE----------------------------------------------------------
             print(output)
 #------------------------------------------------------------------------------------------
     def dividend(self, display: str = 'json'): 
-        valid_params = {'valid_display': ['json', 'table'],}
+        valid_params = {'valid_display': ['json', 'table', 'frame'],}
         
         params = {'display': display}
 
@@ -942,6 +1151,8 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
     
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         yf_dividends = yf.Ticker(self.ticker).get_dividends()
         #----------------------------------------------------------------------------------
@@ -957,16 +1168,18 @@ PRICE ESTIMATE----------------------------------------------------------
         dividends_dict = yf_dividends.to_dict()
         dividends_df = pd.DataFrame.from_dict(dividends_dict, orient='index', columns=['Dividends'])
 
-        #making all values two decimal points
-        dividends_df = dividends_df.map(lambda x: f'{x:.2f}' if isinstance(x, (int, float)) else x)
         dividends_df.index = pd.to_datetime(dividends_df.index)
 
         #PARAMETER - DISPLAY ==============================================================
-        if display == 'json':
+        if display == 'frame':
+            output = dividends_df
+            return output
+        elif display == 'json':
             output = dividends_dict
             return output
         elif display == 'table':
-            output = dividends_df
+            #two decimal point strings, rendered only for the table display
+            output = render(dividends_df, '{:.2f}')
             return output
 #------------------------------------------------------------------------------------------
     def split(self, display: str = 'json'): 
@@ -979,6 +1192,8 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
             
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         yf_splits = yf.Ticker(self.ticker).get_splits()
         #----------------------------------------------------------------------------------
@@ -1013,22 +1228,26 @@ PRICE ESTIMATE----------------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #ANNUAL DATA
-        stmt_df = self.statement(display='table', unit='million') #gathering all statement item data
-        stmt_df = stmt_df.map(lambda x: pd.to_numeric(x.replace(',', ''), errors='coerce') if isinstance(x, str) else x) #returning all df element datatypes to numerics
+        stmt_df = self._statement_frame(unit='million') #gathering all statement item data
         stmt_loc = stmt_df.loc
 
-        yf_raw_IS = yf.Ticker(self.ticker).income_stmt
+        yf_raw_IS = self._financials.statement('income')
 
         #QUARTERLY DATA
-        q_stmt_df = self.statement(display='table', unit='million', interval='quarter')
-        q_stmt_df = q_stmt_df.map(lambda x: pd.to_numeric(x.replace(',', ''), errors='coerce') if isinstance(x, str) else x)
+        q_stmt_df = self._statement_frame(unit='million', interval='quarter')
 
-        yf_raw_qIS = yf.Ticker(self.ticker).quarterly_income_stmt
+        yf_raw_qIS = self._financials.statement('income', interval='quarter')
 
         #OTHER
-        yf_eod = yf.download(self.ticker, progress=False)['Close'].iloc[-1].iloc[0]
+        #one history download, from just before the oldest fiscal year end, for every price lookup
+        fy_ends = yf_raw_IS.columns[0:4]
+        resolver = price_resolver(self.ticker, start=str((min(fy_ends) + timedelta(days=-10)).date()))
+
+        yf_eod = resolver.latest()
 
         yf_quote = yf.Ticker(self.ticker).get_fast_info()
 
@@ -1074,31 +1293,8 @@ PRICE ESTIMATE----------------------------------------------------------
         stmt_loc['EBIT growth rate'] = (stmt_loc['EBIT'] / stmt_df.shift(-1, axis=1).loc['EBIT']) - 1
 
         #ANNUAL FIGURES - VALUATION
-        #fy end date stock prices
-        date_lists = []
-        for i in yf_raw_IS.columns[0:4]:
-            a = []
-            a.append(str(i.date()))
-            a.append(str(i.date() + timedelta(days=-1)))
-            a.append(str(i.date() + timedelta(days=-2)))
-            a.append(str(i.date() + timedelta(days=-3)))
-            a.append(str(i.date() + timedelta(days=-4)))
-            a.append(str(i.date() + timedelta(days=-5)))
-            date_lists.append(a)
-
-        FY_prices = []
-        for date_list in date_lists:
-            for date in date_list:
-                try:
-                    a = yf.download(self.ticker, progress=False, ignore_tz=True).loc[date]
-                    FY_prices.append(float(a.iloc[0]))
-                    break
-                except KeyError:
-                    None
-
-        if len(FY_prices) == len(yf_raw_IS.columns[0:4]):
-            for i in range(len(yf_raw_IS.columns[0:4]) - len(FY_prices)):
-                FY_prices.append(np.nan)
+        #fy end date stock prices (last close within 5 days on or before each fiscal year end)
+        FY_prices = resolver.asof(fy_ends, tolerance=5).tolist()
 
         #valuation ratio calculations
         stmt_loc['stock price'] = FY_prices
@@ -1460,12 +1656,15 @@ CASH FLOW-----------------------------------------------------------------------
             quotes = yf.screen('day_losers')['quotes']
         elif type == 'active':
             quotes = yf.screen('most_actives')['quotes']
+
+        #sector/industry from the profile cache; only uncached symbols are looked up, concurrently
+        quote_profiles = profiles.get_many([quote['symbol'] for quote in quotes])
         #----------------------------------------------------------------------------------
 
         #JSON FORMAT DATA
         quote_data = {}
         for quote in quotes:
-            quote_info = yf.Ticker(quote['symbol']).get_info()
+            quote_info = quote_profiles[quote['symbol']]
 
             quote_data[quote['symbol']] = {
                 'symbol': quote['symbol'],
@@ -0,0 +1,110 @@
+from finflux.base_var import Config
+from finflux.transport import transport, fan_out
+from finflux.cache import atomic_write
+
+import json
+import os
+import threading
+
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+submissions_url = 'https://data.sec.gov/submissions/'
+columns = ['accessionNumber', 'filingDate', 'form']
+
+#------------------------------------------------------------------------------------------
+class filings_store:
+    #Per-CIK record of every filing seen so far. The first sync pages through the older
+    #submissions history files; later syncs only add accession numbers that are not known yet.
+    def __init__(self):
+        self._states = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+#------------------------------------------------------------------------------------------
+    def _path(self, cik: str):
+        return os.path.join(Config.cache_dir, 'sec', 'filings', f'CIK{cik}.json')
+
+    def _cik_lock(self, cik: str):
+        with self._lock:
+            return self._locks.setdefault(cik, threading.Lock())
+
+    def _state(self, cik: str):
+        if cik not in self._states:
+            state = None
+            if Config.cache:
+                try:
+                    with open(self._path(cik), 'r') as file:
+                        state = json.load(file)
+                except (OSError, ValueError):
+                    state = None
+
+            #filings: accession number -> [filing date, form]
+            self._states[cik] = state or {'filings': {}, 'history': False}
+
+        return self._states[cik]
+
+    def _write(self, cik: str, state: dict):
+        if not Config.cache:
+            return
+
+        with atomic_write(self._path(cik)) as file:
+            json.dump(state, file)
+#------------------------------------------------------------------------------------------
+    def _get(self, name: str):
+        headers = {'User-Agent': f"{Config.email_address}"}
+        return transport.get(submissions_url + name, headers=headers).json()
+
+    def sync(self, cik: str):
+        #returns the accession numbers added by this sync, newest first
+        cik = str(cik).zfill(10)
+
+        with self._cik_lock(cik):
+            state = self._state(cik)
+            known = state['filings']
+
+            submissions = self._get(f'CIK{cik}.json')
+
+            #the recent block is newest first, so the first known accession ends the new ones
+            recent = submissions['filings']['recent']
+            new = []
+            for accession, date, form in zip(*(recent[column] for column in columns)):
+                if accession in known:
+                    break
+                new.append((accession, date, form))
+
+            #FIRST SYNC (older history files fetched concurrently, paced by the SEC rate limit)
+            if not state['history']:
+                pages = fan_out(self._get, [file['name'] for file in submissions['filings'].get('files', [])])
+                for page in pages:
+                    for accession, date, form in zip(*(page[column] for column in columns)):
+                        if accession not in known:
+                            new.append((accession, date, form))
+                state['history'] = True
+
+            for accession, date, form in new:
+                known[accession] = [date, form]
+
+            self._write(cik, state)
+
+        return [accession for accession, _, _ in new]
+
+    def sync_many(self, ciks: list):
+        #{cik: new accession numbers} for a watch list, one sync per CIK across the worker pool
+        ciks = [str(cik).zfill(10) for cik in ciks]
+        return dict(zip(ciks, fan_out(self.sync, ciks)))
+#------------------------------------------------------------------------------------------
+    def frame(self, cik: str, accessions: list = None):
+        #every known filing (or only the given accession numbers), newest filing date first
+        cik = str(cik).zfill(10)
+
+        with self._cik_lock(cik):
+            known = self._state(cik)['filings']
+            rows = {accession: known[accession] for accession in (known if accessions is None else accessions)}
+
+        output = pd.DataFrame.from_dict(rows, orient='index', columns=columns[1:])
+        output.index.name = columns[0]
+
+        return output.sort_values('filingDate', ascending=False, kind='stable')
+
+#------------------------------------------------------------------------------------------
+sec_filings = filings_store()
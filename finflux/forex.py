@@ -1,8 +1,13 @@
 from finflux.base_var import Config
+from finflux.transport import transport
+from finflux.aio import awaitable
+from finflux.lookback import lookback_stats
+from finflux.validation import quote_type, quote_types
+from finflux.intraday import download
+from finflux.realtime import realtime_prices
 
 import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 from typing import Union
 
@@ -20,6 +25,7 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class forex:
     security_type = 'CURRENCY'
 
@@ -35,10 +41,44 @@ class forex:
 
         self.tdticker = f'{self.from_currency}/{self.to_currency}'
 
-        instrumentType = yf.Ticker(self.yfticker).get_info()['quoteType']
-        if instrumentType != forex.security_type:
+        #the security type is checked on the first data call rather than at construction
+        self._validated = False
+
+    def _validate(self):
+        if self._validated:
+            return
+
+        if quote_type(self.yfticker) != forex.security_type:
             raise InvalidSecurityError(f"Invalid security type. "
                                        f"Please select a valid '{forex.security_type}' symbol")
+        self._validated = True
+
+    @classmethod
+    def validate(cls, tickers: list):
+        #checking many pairs with a few batched quote requests: {ticker: is valid pair}
+        yftickers = {ticker: forex(ticker).yfticker for ticker in tickers}
+        types = quote_types(list(yftickers.values()))
+        return {ticker: types[yfticker] == forex.security_type for ticker, yfticker in yftickers.items()}
+
+    @classmethod
+    def realtime_many(cls, tickers: list):
+        if Config.td_apikey is None:
+            raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
+
+        pairs = {ticker: cls(ticker) for ticker in dict.fromkeys(tickers)}
+
+        invalid = [ticker for ticker, valid in cls.validate(list(pairs)).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{forex.security_type}' symbols")
+
+        #RAW DATA/OBSERVATION--------------------------------------------------------------
+        td_prices = realtime_prices([pair.tdticker for pair in pairs.values()])
+        #----------------------------------------------------------------------------------
+
+        output = {ticker: {'symbol': f'{pair.from_currency} {pair.to_currency}',
+                           'price': td_prices[pair.tdticker]} for ticker, pair in pairs.items()}
+        return output
 #------------------------------------------------------------------------------------------
     def help(self):
         output = '''
@@ -47,7 +87,7 @@ class forex():
  |      period      :str        =5y         [1mo, 6mo, 1y, 2y, 5y, 10y, ytd, max]
  |      start       :str        =None       [YYYY-MM-DD*]
  |      end         :str        =None       [YYYY-MM-DD*]
- |      interval    :str        =1d         [1d, 1wk, 1mo, 3mo]
+ |      interval    :str        =1d         [1m, 5m, 15m, 1h, 1d, 1wk, 1mo, 3mo]
  |      data        :str        =all        [open, high, low, close, all]
  |      round       :bool       =True       [True, False]
  |      -----api(s): yfinance
@@ -55,6 +95,10 @@ class forex():
  |  realtime()--------------Forex pair realtime exchange rate
  |      display     :str        =json       [json, pretty]
  |      -----api(s): twelve data
+ |
+ |  realtime_many()---------Realtime exchange rates for many pairs in batched requests (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      -----api(s): twelve data
  |      
  |  conversion()------------Forex pair currency conversion calculator
  |      display     :str        =json       [json, pretty]
@@ -75,7 +119,7 @@ class forex():
 #------------------------------------------------------------------------------------------
     def timeseries(self, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True): 
         valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
-                        'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
+                        'valid_interval' : ['1m', '5m', '15m', '1h', '1d', '1wk', '1mo', '3mo'],
                         'valid_data' : ['open', 'high', 'low', 'close', 'all'],
                         'valid_calculation' : ['price', 'simple return', 'log return'],
                         'valid_round' : [True, False]}
@@ -91,8 +135,10 @@ class forex():
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATION--------------------------------------------------------------
-        timeseries_data = yf.download(self.yfticker, period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False)
+        timeseries_data = download(self.yfticker, period=period, start=start, end=end, interval=interval, round=round)
         #----------------------------------------------------------------------------------
 
         #PARAMETER - DATA =================================================================
@@ -126,9 +172,11 @@ class forex():
         if Config.td_apikey is None:
             raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
 
+        self._validate()
+
         #RAW DATA/OBSERVATION--------------------------------------------------------------
         url = Config.td_baseurl + f'price?apikey={Config.td_apikey}&symbol={self.tdticker}'
-        td_realtime = requests.get(url).json()
+        td_realtime = transport.get(url).json()
         #----------------------------------------------------------------------------------
         
         realtime_data = {
@@ -157,6 +205,8 @@ Exchange Rate: {realtime_data['price']}
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #PARAMETER - RATE =================================================================
         if rate == 'realtime':
             conversion_rate = float(self.realtime()['price'])
@@ -202,17 +252,22 @@ Post-conversion: {round(data['post-conversion'],2)}
         if Config.td_apikey is None:
             raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        price_data = yf.download(self.yfticker, progress=False)
+        quote_start = str((pd.Timestamp.now() - pd.DateOffset(years=5, months=2)).date())
+
+        yf_ticker = yf.Ticker(self.yfticker)
+
+        price_data = yf_ticker.history(start=quote_start)
 
-        yf_history_metadata = yf.Ticker(self.yfticker).get_history_metadata()
+        yf_history_metadata = yf_ticker.get_history_metadata()
         
         url_1 = f'{Config.td_baseurl}quote?symbol={self.tdticker}&apikey={Config.td_apikey}'
-        td_quote = requests.get(url_1).json()
+        td_quote = transport.get(url_1).json()
 
-        yf_eod = yf.download(self.yfticker, progress=False)['Close'].iloc[-1].iloc[0]
+        lookback = lookback_stats(price_data['Close'], price_data['High'], price_data['Low'])
 
-        current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
@@ -223,25 +278,18 @@ Post-conversion: {round(data['post-conversion'],2)}
             'timezone': yf_history_metadata.get('timezone','-'),
             'last trading day': {
                 'date': str(price_data.index[-1].date()),
-                'open': float((price_data['Open'].iloc[-1]).iloc[0]),
-                'high': float((price_data['High'].iloc[-1]).iloc[0]),
-                'low': float((price_data['Low'].iloc[-1]).iloc[0]),
-                'close': float((price_data['Close'].iloc[-1]).iloc[0])
+                'open': float(price_data['Open'].iloc[-1]),
+                'high': float(price_data['High'].iloc[-1]),
+                'low': float(price_data['Low'].iloc[-1]),
+                'close': float(price_data['Close'].iloc[-1])
             },
             'ttm': {
-                'high': round(float((price_data['High'].iloc[-252:].max()).iloc[0]),2),
-                'low': round(float((price_data['Low'].iloc[-252:].min()).iloc[0]),2)
+                'high': round(lookback['ttm high'],2),
+                'low': round(lookback['ttm low'],2)
             },
-            'percent change': {
-                '5y': float(((yf_eod/price_data['Close'].iloc[-1260]) - 1).iloc[0]) if price_data.shape[0]>1260 else np.nan,
-                '1y': float(((yf_eod/price_data['Close'].iloc[-252]) - 1).iloc[0]) if price_data.shape[0]>252 else np.nan,
-                'ytd': float(((yf_eod/price_data['Close'][price_data.index.year == current_year].iloc[0]) - 1).iloc[0]),
-                '6m': float(((yf_eod/price_data['Close'].iloc[-126]) - 1).iloc[0]) if price_data.shape[0]>126 else np.nan,
-                '1m': float(((yf_eod/price_data['Close'].iloc[-21]) - 1).iloc[0]) if price_data.shape[0]>21 else np.nan,
-                '5d': float(((yf_eod/price_data['Close'].iloc[-5]) - 1).iloc[0]) if price_data.shape[0]>5 else np.nan
-            },
-            '50d average price': float((price_data['Close'].iloc[-50:].mean()).iloc[0]),
-            '200d average price': float((price_data['Close'].iloc[-200:].mean()).iloc[0])
+            'percent change': lookback['percent change'],
+            '50d average price': lookback['average price']['50d'],
+            '200d average price': lookback['average price']['200d']
         }
 
         #PARAMETER - DISPLAY ==============================================================
@@ -284,6 +332,8 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS---------------------------------------------------------
         news = yf.Ticker(self.yfticker).get_news()
         #------------------------------------------------------------------------------
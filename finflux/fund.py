@@ -1,8 +1,14 @@
 from finflux.base_var import Config
+from finflux.aio import awaitable
+from finflux.cik import directory
+from finflux.lookback import lookback_stats
+from finflux.render import render
+from finflux.validation import quote_type, quote_types
+from finflux.intraday import download
+from finflux.snapshot import fund_profile
+from finflux.holdings import fetch_holdings, holdings_matrices, six_month_returns
 
-import yfinance as yf # type: ignore
 import numpy as np # type: ignore
-import requests # type: ignore
 import pandas as pd # type: ignore
 
 #------------------------------------------------------------------------------------------
@@ -19,6 +25,7 @@ class MissingConfigObject(Exception):
         self.msg = msg
 
 #------------------------------------------------------------------------------------------
+@awaitable
 class fund:
     security_type_1 = 'ETF'
     security_type_2 = 'MUTUALFUND'
@@ -26,10 +33,62 @@ class fund:
     def __init__(self,ticker):
         self.ticker = ticker
 
-        quoteType = yf.Ticker(self.ticker).get_info()['quoteType']
+        #the security type is checked on the first data call rather than at construction
+        self._validated = False
+
+        #Ticker, info and funds data, fetched once per instance on first use
+        self._profile = fund_profile(ticker)
+
+    def _validate(self):
+        if self._validated:
+            return
+
+        quoteType = quote_type(self.ticker)
         if quoteType != fund.security_type_1 and quoteType != fund.security_type_2:
             raise InvalidSecurityError(f"Invalid security type. "
                                        f"Please select a valid '{fund.security_type_1}' or '{fund.security_type_2}' symbol")
+        self._validated = True
+
+    @classmethod
+    def validate(cls, tickers: list):
+        #checking many symbols with a few batched quote requests: {ticker: is valid fund}
+        types = quote_types(tickers)
+        return {ticker: types[ticker] in (fund.security_type_1, fund.security_type_2) for ticker in tickers}
+
+    @classmethod
+    def overlap_matrix(cls, tickers: list, display: str = 'table'):
+        valid_params = {'valid_display': ['json', 'table']}
+
+        params = {'display': display}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        tickers = list(dict.fromkeys(tickers))
+
+        invalid = [ticker for ticker, valid in cls.validate(tickers).items() if not valid]
+        if invalid:
+            raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                       f"Please select valid '{fund.security_type_1}' or '{fund.security_type_2}' symbols")
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        #top holdings of every fund in one concurrent pass, as a sparse fund x holding weight matrix
+        matrices = holdings_matrices(fetch_holdings(tickers))
+        #----------------------------------------------------------------------------------
+
+        #overlap of two funds: the sum over shared holdings of the smaller of their two weights
+        overlap = matrices.holding_matrix.min_gram()
+        overlap_df = pd.DataFrame(overlap, index=pd.Index(matrices.funds, name='Ticker'), columns=matrices.funds)
+
+        #PARAMETER - DISPLAY ==============================================================
+        if display == 'json':
+            output = overlap_df.to_dict(orient='index')
+            return output
+        elif display == 'table':
+            output = overlap_df
+            return output
 #------------------------------------------------------------------------------------------
     def help(self):
         output = '''
@@ -38,7 +97,7 @@ class fund():
  |      period      :str        =5y         [1mo, 6mo, 1y, 2y, 5y, 10y, ytd, max]
  |      start       :str        =None       [YYYY-MM-DD*]
  |      end         :str        =None       [YYYY-MM-DD*]
- |      interval    :str        =1d         [1d, 1wk, 1mo, 3mo]
+ |      interval    :str        =1d         [1m, 5m, 15m, 1h, 1d, 1wk, 1mo, 3mo]
  |      data        :str        =all        [open, high, low, close, all]
  |      round       :bool       =True       [True, False]
  |      -----api(s): yfinance
@@ -50,6 +109,11 @@ class fund():
  |  equity_holdings()-------Top ten equity holdings
  |      display     :str        =json       [json, table]
  |      -----api(s): yfinance
+ |
+ |  overlap_matrix()--------Pairwise top holdings weight overlap across many funds (classmethod)
+ |      tickers     :list       =           [TICKER*]
+ |      display     :str        =table      [json, table]
+ |      -----api(s): yfinance
  |      
  |  info()------------------General fund info: sector weighting, asset classes, etc.
  |      display     :str        =json       [json, pretty]
@@ -68,7 +132,7 @@ class fund():
  |      -----api(s): yfinance
  |
  |  dividend()--------------Fund dividend timeseries
- |      display     :str        =json       [json, table]
+ |      display     :str        =json       [json, table, frame]
  |      -----api(s): yfinance
 '''
 
@@ -76,7 +140,7 @@ class fund():
 #------------------------------------------------------------------------------------------
     def timeseries(self, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', data: str = 'all', calculation: str = 'price', round: bool = True):
         valid_params = {'valid_period' : ['1mo', '6mo', '1y', '2y', '5y', '10y', 'ytd', 'max'],
-                        'valid_interval' : ['1d', '1wk', '1mo', '3mo'],
+                        'valid_interval' : ['1m', '5m', '15m', '1h', '1d', '1wk', '1mo', '3mo'],
                         'valid_data' : ['open', 'high', 'low', 'close', 'volume', 'all'],
                         'valid_calculation' : ['price', 'simple return', 'log return'],
                         'valid_round' : [True, False]}
@@ -92,10 +156,12 @@ class fund():
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
         #Downloading the raw price data timeseries from yahoo finance with some presets'''
         #Note: The start, end parameters override the period parameter
-        yf_download = yf.download(self.ticker, period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False)
+        yf_download = download(self.ticker, period=period, start=start, end=end, interval=interval, round=round)
         #----------------------------------------------------------------------------------
 
         #PARAMETER - DATA =================================================================
@@ -124,13 +190,15 @@ class fund():
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_download = yf.download(self.ticker, period='1mo', progress=False)
+        yf_download = self._profile.firm.history(period='1mo')
 
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self._profile.info()
         #----------------------------------------------------------------------------------
 
-        eod = yf_download['Close'].iloc[-1].iloc[0]
+        eod = yf_download['Close'].iloc[-1]
         
         #JSON FORMAT DATA
         eod_data = {'symbol': self.ticker,
@@ -157,22 +225,21 @@ Currency: {eod_data['currency']}'''
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_top_holdings = yf.Ticker(self.ticker).get_funds_data().top_holdings
+        yf_top_holdings = self._profile.funds_data().top_holdings.copy()
         #----------------------------------------------------------------------------------
 
         #ADDING 6MO RETURN COLUMN
-        def six_month_return(ticker):
-            data = yf.download(ticker, period='6mo', progress=False)['Close']
-            raw = (data.iloc[-1].iloc[0]/data.iloc[0].iloc[0]) - 1
-            six_mo = str(round(raw * 100,2)) + '%'
-            return six_mo
+        #one multi-symbol download for the holdings, shared with other funds holding the same names
+        holdings_return = pd.Series(six_month_returns(list(yf_top_holdings.index)), dtype=float)
 
         yf_top_holdings['Holding Percent'] = (round(yf_top_holdings['Holding Percent']*100,2)).astype(str)
 
         yf_top_holdings['Holding Percent'] = yf_top_holdings['Holding Percent'].map(lambda x: f'{x}%')
 
-        yf_top_holdings['6MO Return'] = yf_top_holdings.index.map(lambda x: six_month_return(x))
+        yf_top_holdings['6MO Return'] = holdings_return.reindex(yf_top_holdings.index).map(lambda x: f'{round(x * 100, 2)}%' if pd.notna(x) else '-')
 
         #PARAMETER - DISPLAY ==============================================================
         if display == 'json':
@@ -195,29 +262,21 @@ Currency: {eod_data['currency']}'''
         if Config.email_address is None:
             raise MissingConfigObject('Missing email_address. Please set your email address using the set_config() function.')
         
-        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_info = yf.Ticker(self.ticker).get_info()
-
-        yf_sector_weights = yf.Ticker(self.ticker).get_funds_data().sector_weightings
-
-        yf_fund_operations = yf.Ticker(self.ticker).get_funds_data().fund_operations
+        self._validate()
 
-        yf_asset_classes = yf.Ticker(self.ticker).get_funds_data().asset_classes
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        yf_info = self._profile.info()
 
-        #cik id
-        sec_headers = {'User-Agent': f"{Config.email_address}"}
-        sec_list = requests.get("https://www.sec.gov/files/company_tickers.json", headers=sec_headers).json()
+        yf_funds_data = self._profile.funds_data()
 
-        companyData = pd.DataFrame.from_dict(sec_list, orient='index')
+        yf_sector_weights = yf_funds_data.sector_weightings
 
-        companyData['cik_str'] = companyData['cik_str'].astype(str).str.zfill(10)
+        yf_fund_operations = yf_funds_data.fund_operations
 
-        try:
-            index_of_ticker = int(companyData[companyData['ticker'] == self.ticker].index[0])
+        yf_asset_classes = yf_funds_data.asset_classes
 
-            cik = companyData.iloc[index_of_ticker,0]
-        except IndexError:
-            cik = '-'
+        #cik id
+        cik = directory.cik(self.ticker) or '-'
         #----------------------------------------------------------------------------------
 
         #JSON FORMAT DATA
@@ -282,8 +341,10 @@ ASSET CLASSES-----------------------------------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
         
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_news = yf.Ticker(self.ticker).get_news()
+        yf_news = self._profile.firm.get_news()
         #----------------------------------------------------------------------------------
 
         #JSON FORMAT DATA
@@ -328,14 +389,17 @@ URL: {i['url']}
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
 
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_download = yf.download(self.ticker, progress=False, period='10y')
+        quote_start = str((pd.Timestamp.now() - pd.DateOffset(years=5, months=2)).date())
+
+        yf_download = self._profile.firm.history(start=quote_start)
         
-        yf_info = yf.Ticker(self.ticker).get_info()
+        yf_info = self._profile.info()
         
-        eod_price = fund(self.ticker).eod()['eod price']
+        lookback = lookback_stats(yf_download['Close'], yf_download['High'], yf_download['Low'], yf_download['Volume'])
 
-        current_year = pd.Timestamp.now().year
         #----------------------------------------------------------------------------------
         
         #JSON FORMAT DATA
@@ -347,28 +411,21 @@ URL: {i['url']}
             'timezone': yf_info.get('timeZoneShortName','-'),
             'last trading day': {
                 'date': str(yf_download.index[-1].date()),
-                'open': float((yf_download['Open'].iloc[-1]).iloc[0]),
-                'high': float((yf_download['High'].iloc[-1]).iloc[0]),
-                'low': float((yf_download['Low'].iloc[-1]).iloc[0]),
-                'close': float((yf_download['Close'].iloc[-1]).iloc[0]),
-                'volume': int((yf_download['Volume'].iloc[-1]).iloc[0])
+                'open': float(yf_download['Open'].iloc[-1]),
+                'high': float(yf_download['High'].iloc[-1]),
+                'low': float(yf_download['Low'].iloc[-1]),
+                'close': float(yf_download['Close'].iloc[-1]),
+                'volume': int(yf_download['Volume'].iloc[-1])
             },
             'ttm': {
-                'high': round(float((yf_download['High'].iloc[-252:].max()).iloc[0]),2),
-                'low': round(float((yf_download['Low'].iloc[-252:].min()).iloc[0]),2)
+                'high': round(lookback['ttm high'],2),
+                'low': round(lookback['ttm low'],2)
             },
-            'percent change': {
-                '5y': float(((eod_price/yf_download['Close'].iloc[-1260]) - 1).iloc[0]) if yf_download.shape[0]>1260 else np.nan,
-                '1y': float(((eod_price/yf_download['Close'].iloc[-252]) - 1).iloc[0]) if yf_download.shape[0]>252 else np.nan,
-                'ytd': float(((eod_price/yf_download['Close'][yf_download.index.year == current_year].iloc[0]) - 1).iloc[0]),
-                '6m': float(((eod_price/yf_download['Close'].iloc[-126]) - 1).iloc[0]) if yf_download.shape[0]>126 else np.nan,
-                '1m': float(((eod_price/yf_download['Close'].iloc[-21]) - 1).iloc[0]) if yf_download.shape[0]>21 else np.nan,
-                '5d': float(((eod_price/yf_download['Close'].iloc[-5]) - 1).iloc[0]) if yf_download.shape[0]>5 else np.nan
-            },
-            '50d average price': float((yf_download['Close'].iloc[-50:].mean()).iloc[0]),
-            '200d average price': float((yf_download['Close'].iloc[-200:].mean()).iloc[0]),
-            '10d average volume': int((yf_download['Volume'].iloc[-10:].mean()).iloc[0]),
-            '90d average volume': int((yf_download['Volume'].iloc[-90:].mean()).iloc[0]),
+            'percent change': lookback['percent change'],
+            '50d average price': lookback['average price']['50d'],
+            '200d average price': lookback['average price']['200d'],
+            '10d average volume': int(lookback['average volume']['10d']),
+            '90d average volume': int(lookback['average volume']['90d']),
         }
 
         #PARAMETER - DISPLAY ==============================================================
@@ -415,8 +472,10 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
             
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_splits = yf.Ticker(self.ticker).get_splits()
+        yf_splits = self._profile.firm.get_splits()
         #----------------------------------------------------------------------------------
 
         renamed_dates = {}
@@ -438,7 +497,7 @@ MOVING AVERAGES-------------------------
             return splits_df
 #------------------------------------------------------------------------------------------
     def dividend(self, display: str = 'json'):
-        valid_params = {'valid_display': ['json', 'table'],}
+        valid_params = {'valid_display': ['json', 'table', 'frame'],}
         
         params = {'display': display}
 
@@ -447,8 +506,10 @@ MOVING AVERAGES-------------------------
                 raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
                                             f"Please choose a valid parameter: {', '.join(valid_param)}")
     
+        self._validate()
+
         #RAW DATA/OBSERVATIONS-------------------------------------------------------------
-        yf_dividends = yf.Ticker(self.ticker).get_dividends()
+        yf_dividends = self._profile.firm.get_dividends()
         #----------------------------------------------------------------------------------
 
         renamed_dates = {}
@@ -462,14 +523,15 @@ MOVING AVERAGES-------------------------
         dividends_dict = yf_dividends.to_dict()
         dividends_df = pd.DataFrame.from_dict(dividends_dict, orient='index', columns=['Dividends'])
 
-        #making all values two decimal points
-        dividends_df = dividends_df.map(lambda x: f'{x:.2f}' if isinstance(x, (int, float)) else x)
-
         #PARAMETER - DISPLAY ==============================================================
-        if display == 'json':
+        if display == 'frame':
+            output = dividends_df
+            return output
+        elif display == 'json':
             output = dividends_dict
             return output
         elif display == 'table':
-            output = dividends_df
+            #two decimal point strings, rendered only for the table display
+            output = render(dividends_df, '{:.2f}')
             return output
 #------------------------------------------------------------------------------------------
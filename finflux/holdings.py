@@ -0,0 +1,132 @@
+from finflux.transport import fan_out
+from finflux.snapshot import fund_profile
+
+import threading
+import time
+
+import numpy as np # type: ignore
+import yfinance as yf # type: ignore
+
+#------------------------------------------------------------------------------------------
+#holding symbol -> (fetched time, 6 month return), shared by every fund's holdings table so
+#constituents common to many funds are downloaded once per window
+returns_ttl = 300
+_returns = {}
+_returns_lock = threading.Lock()
+
+#symbol -> event set once the download fetching it finishes, so a call only waits for the
+#symbols it shares with a download already on the wire
+_returns_inflight = {}
+
+#------------------------------------------------------------------------------------------
+class sparse_matrix:
+    #row x column matrix kept as (row, column, value) triplets sorted by row, numpy only
+    def __init__(self, rows: list, cols: list, values: list, shape: tuple):
+        self.rows = np.asarray(rows, dtype=np.int64)
+        self.cols = np.asarray(cols, dtype=np.int64)
+        self.values = np.asarray(values, dtype=float)
+        self.shape = shape
+
+    def tmatvec(self, vector: np.ndarray):
+        #transpose times vector: every stored entry adds value * vector[row] to its column
+        #bincount falls back to integer counts when there are no entries to weight
+        return np.bincount(self.cols, weights=self.values * vector[self.rows], minlength=self.shape[1]).astype(float, copy=False)
+
+    def min_gram(self):
+        #row x row matrix of sum over columns of min(A[i, k], A[j, k]), built like A times its
+        #transpose as one pass of per column outer products, with min in place of multiply
+        order = np.argsort(self.cols, kind='stable')
+        rows, cols, values = self.rows[order], self.cols[order], self.values[order]
+
+        #every entry is paired with each entry of its own column (itself included)
+        counts = np.bincount(cols, minlength=self.shape[1])
+        starts = np.cumsum(counts) - counts
+        pair_counts = counts[cols]
+
+        left = np.repeat(np.arange(len(cols)), pair_counts)
+        pair_offsets = np.cumsum(pair_counts) - pair_counts
+        right = np.repeat(starts[cols], pair_counts) + (np.arange(len(left)) - np.repeat(pair_offsets, pair_counts))
+
+        n = self.shape[0]
+        output = np.bincount(rows[left] * n + rows[right], weights=np.minimum(values[left], values[right]), minlength=n * n).astype(float, copy=False)
+        return output.reshape(n, n)
+
+#------------------------------------------------------------------------------------------
+def _fund_holdings(ticker: str):
+    funds_data = fund_profile(ticker).funds_data()
+
+    top_holdings = funds_data.top_holdings
+    holdings = {symbol: (name, float(weight)) for symbol, name, weight
+                in zip(top_holdings.index, top_holdings['Name'], top_holdings['Holding Percent'])}
+    sectors = {sector: float(weight) for sector, weight in (funds_data.sector_weightings or {}).items()}
+
+    return holdings, sectors
+
+def fetch_holdings(tickers: list):
+    #{fund: ({symbol: (name, weight)}, {sector: weight})} from one concurrent pass over the funds
+    tickers = list(dict.fromkeys(tickers))
+    return dict(zip(tickers, fan_out(_fund_holdings, tickers)))
+
+#------------------------------------------------------------------------------------------
+class holdings_matrices:
+    #fund x holding and fund x sector weight matrices over a set of fetched funds
+    def __init__(self, fetched: dict):
+        self.funds = list(fetched)
+        self.fund_index = {ticker: row for row, ticker in enumerate(self.funds)}
+
+        holding_index, sector_index, names = {}, {}, {}
+        holding_entries, sector_entries = [], []
+        for row, (holdings, sectors) in enumerate(fetched.values()):
+            for symbol, (name, weight) in holdings.items():
+                names.setdefault(symbol, name)
+                holding_entries.append((row, holding_index.setdefault(symbol, len(holding_index)), weight))
+            for sector, weight in sectors.items():
+                sector_entries.append((row, sector_index.setdefault(sector, len(sector_index)), weight))
+
+        self.holdings = list(holding_index)
+        self.names = [names[symbol] for symbol in self.holdings]
+        self.sectors = list(sector_index)
+
+        self.holding_matrix = sparse_matrix(*self._triplets(holding_entries), (len(self.funds), len(self.holdings)))
+        self.sector_matrix = sparse_matrix(*self._triplets(sector_entries), (len(self.funds), len(self.sectors)))
+
+    def _triplets(self, entries: list):
+        if not entries:
+            return [], [], []
+        return tuple(map(list, zip(*entries)))
+
+#------------------------------------------------------------------------------------------
+def six_month_returns(symbols: list):
+    #{symbol: 6 month price return}, every symbol without a recent entry in one multi-symbol download
+    symbols = list(dict.fromkeys(symbols))
+
+    with _returns_lock:
+        now = time.time()
+        stale = [symbol for symbol in symbols if symbol not in _returns or now - _returns[symbol][0] >= returns_ttl]
+
+        pending = [_returns_inflight[symbol] for symbol in stale if symbol in _returns_inflight]
+        missing = [symbol for symbol in stale if symbol not in _returns_inflight]
+        for symbol in missing:
+            _returns_inflight[symbol] = threading.Event()
+
+    if missing:
+        returns = {}
+        try:
+            close = yf.download(missing, period='6mo', ignore_tz=True, group_by='column', progress=False, threads=True)['Close']
+            #older yfinance returns a plain Series for a single symbol
+            if close.ndim == 1:
+                close = close.to_frame(missing[0])
+            if not close.empty:
+                returns = ((close.ffill().iloc[-1] / close.bfill().iloc[0]) - 1).to_dict()
+        finally:
+            with _returns_lock:
+                #symbols yahoo had no prices for are left out and tried again on the next call
+                _returns.update({symbol: (now, float(value)) for symbol, value in returns.items() if np.isfinite(value)})
+                for symbol in missing:
+                    _returns_inflight.pop(symbol).set()
+
+    for event in pending:
+        event.wait()
+
+    with _returns_lock:
+        return {symbol: _returns[symbol][1] if symbol in _returns else np.nan for symbol in symbols}
@@ -0,0 +1,119 @@
+from finflux.base_var import Config
+from finflux.transport import fan_out
+from finflux.store import prices, fields
+
+import pandas as pd # type: ignore
+import yfinance as yf # type: ignore
+
+#------------------------------------------------------------------------------------------
+intraday_intervals = ['1m', '5m', '15m', '1h']
+
+#how far back yahoo keeps each intraday interval, and the span of one request; requests stay
+#well inside yahoo's per request limit so a long window splits into chunks fetched in parallel
+lookback_days = {'1m': 29, '5m': 59, '15m': 59, '1h': 729}
+chunk_days = {'1m': 7, '5m': 15, '15m': 30, '1h': 180}
+
+period_offsets = {'1mo': pd.DateOffset(months=1),
+                  '6mo': pd.DateOffset(months=6),
+                  '1y': pd.DateOffset(years=1),
+                  '2y': pd.DateOffset(years=2),
+                  '5y': pd.DateOffset(years=5),
+                  '10y': pd.DateOffset(years=10)}
+
+#------------------------------------------------------------------------------------------
+def _bounds(period: str, start: str, end: str):
+    #[start, end) of the request, None for an open end
+    now = pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+
+    window_end = pd.Timestamp(end).normalize() if end is not None else None
+    if start is not None:
+        window_start = pd.Timestamp(start).normalize()
+    elif period == 'ytd':
+        window_start = pd.Timestamp(year=now.year, month=1, day=1)
+    elif period == 'max':
+        window_start = None
+    else:
+        window_start = now - period_offsets[period]
+    return window_start, window_end
+
+def _windows(period: str, start: str, end: str, interval: str):
+    #[start, end) day ranges covering the request, clipped to what yahoo still keeps
+    now = pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+    earliest = now - pd.Timedelta(days=lookback_days[interval])
+
+    window_start, window_end = _bounds(period, start, end)
+    window_start = max(window_start, earliest) if window_start is not None else earliest
+    window_end = min(window_end, now) if window_end is not None else now
+
+    windows = []
+    while window_start < window_end:
+        chunk_end = min(window_start + pd.Timedelta(days=chunk_days[interval]), window_end)
+        windows.append((window_start, chunk_end))
+        window_start = chunk_end
+    return windows
+
+def _fetch(job):
+    ticker, chunk_start, chunk_end, interval = job
+    history = yf.Ticker(ticker).history(start=chunk_start.strftime('%Y-%m-%d'), end=chunk_end.strftime('%Y-%m-%d'), interval=interval)
+    return history.reindex(columns=fields)
+
+def _panel(frames: dict, tickers: list, index_name: str, round: bool):
+    #per ticker frames joined into yf.download's (price field, ticker) column panel
+    columns = pd.MultiIndex.from_product([fields, tickers], names=['Price', 'Ticker'])
+    frames = {ticker: frame for ticker, frame in frames.items() if not frame.empty}
+    if not frames:
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], name=index_name))
+
+    output = pd.concat(frames, axis=1).swaplevel(axis=1).reindex(columns=columns).sort_index()
+    output.index.name = index_name
+
+    if round == True:
+        output = output.round(2)
+
+    return output
+#------------------------------------------------------------------------------------------
+def _stored(tickers: list, end: str, interval: str, round: bool):
+    #full daily and longer histories from the local price store, only the bars after the last stored one are downloaded
+    histories = prices.histories(tickers, interval)
+    window_end = pd.Timestamp(end).normalize() if end is not None else None
+
+    frames = {}
+    for ticker, history in histories.items():
+        frames[ticker] = history[history.index < window_end] if window_end is not None else history
+
+    return _panel(frames, tickers, 'Date', round)
+
+def _intraday(tickers: list, period: str, start: str, end: str, interval: str, round: bool):
+    #intraday bars fetched per (ticker, chunk) across the worker pool and stitched back together
+    windows = _windows(period, start, end, interval)
+
+    jobs = [(ticker, chunk_start, chunk_end, interval) for ticker in tickers for chunk_start, chunk_end in windows]
+    chunks = fan_out(_fetch, jobs)
+
+    frames = {}
+    for (ticker, _, _, _), chunk in zip(jobs, chunks):
+        if not chunk.empty:
+            frames.setdefault(ticker, []).append(chunk)
+
+    #neighbouring chunks can share a boundary bar, the later copy is kept
+    stitched = {}
+    for ticker, ticker_frames in frames.items():
+        frame = pd.concat(ticker_frames)
+        frame.index = frame.index.tz_localize(None)
+        stitched[ticker] = frame[~frame.index.duplicated(keep='last')]
+
+    return _panel(stitched, tickers, 'Datetime', round)
+
+def download(tickers, period: str = '5y', start: str = None, end: str = None, interval: str = '1d', round: bool = True):
+    #drop-in for yf.download: intraday bars are downloaded in parallel chunks; full daily and
+    #longer histories (period='max') come from the local price store when set_config(price_store=True)
+    if interval in intraday_intervals:
+        tickers = [tickers] if isinstance(tickers, str) else list(dict.fromkeys(tickers))
+        return _intraday(tickers, period, start, end, interval, round)
+
+    if Config.price_store and Config.cache and period == 'max' and start is None:
+        tickers = [tickers] if isinstance(tickers, str) else list(dict.fromkeys(tickers))
+        return _stored(tickers, end, interval, round)
+
+    #bounded windows are cheaper to download directly than to keep in the store
+    return yf.download(tickers, period=period, start=start, end=end, interval=interval, ignore_tz=True, rounding=round, group_by='column', progress=False, threads=True)
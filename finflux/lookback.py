@@ -0,0 +1,98 @@
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+#trading-day lookbacks shared by every quote() method
+change_lags = {'5y': 1260, '1y': 252, '6m': 126, '1m': 21, '5d': 5}
+price_windows = {'50d': 50, '200d': 200}
+volume_windows = {'10d': 10, '90d': 90}
+ttm_window = 252
+
+#------------------------------------------------------------------------------------------
+def _as_panel(values):
+    #rows are observations, columns are symbols; a single series becomes one column
+    values = np.asarray(values, dtype=float)
+    return values.reshape(len(values), -1)
+
+def _ffill(values: np.ndarray):
+    #carrying the last valid observation forward (FRED style gaps) without a python loop
+    index = np.where(np.isnan(values), 0, np.arange(values.shape[0])[:, None])
+    np.maximum.accumulate(index, axis=0, out=index)
+    return np.take_along_axis(values, index, axis=0)
+
+def _window_means(values: np.ndarray, windows: dict):
+    #every trailing mean from one prefix sum of values and one of valid counts
+    n = values.shape[0]
+    valid = ~np.isnan(values)
+    sums = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(np.where(valid, values, 0), axis=0)])
+    counts = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(valid, axis=0)])
+
+    means = {}
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for key, window in windows.items():
+            start = n - min(window, n)
+            means[key] = (sums[n] - sums[start]) / (counts[n] - counts[start])
+    return means
+
+def _trailing_extreme(values: np.ndarray, window: int, ufunc):
+    #running extrema from the latest row backwards: row w-1 is the extreme of the last w rows
+    running = ufunc.accumulate(values[::-1], axis=0)
+    return running[min(window, values.shape[0]) - 1]
+
+def _squeeze(value, single: bool):
+    if isinstance(value, dict):
+        return {key: _squeeze(item, single) for key, item in value.items()}
+    return float(value[0]) if single else value
+
+#------------------------------------------------------------------------------------------
+def lookback_stats(close, high=None, low=None, volume=None, dates=None):
+    #close/high/low/volume: one series or an (observations x symbols) panel in date order
+    single = np.ndim(close) == 1
+    if dates is None and hasattr(close, 'index'):
+        dates = close.index
+
+    raw = _as_panel(close)
+    close = _ffill(raw)
+    high = raw if high is None else _as_panel(high)
+    low = raw if low is None else _as_panel(low)
+    n = close.shape[0]
+
+    eod = close[-1]
+
+    #PERCENT CHANGE ===============================================================
+    lags = np.array(list(change_lags.values()))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        changes = eod / close[np.clip(n - lags, 0, None)] - 1
+    changes[lags >= n] = np.nan
+
+    percent_change = dict(zip(change_lags.keys(), changes))
+
+    #year to date is measured from the first observation of the current calendar year
+    ytd = np.full(close.shape[1], np.nan)
+    if dates is not None:
+        years = np.asarray(pd.DatetimeIndex(dates).year)
+        first = np.searchsorted(years, pd.Timestamp.now().year)
+        if first < n:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ytd = eod / close[first] - 1
+
+    percent_change = {'5y': percent_change['5y'],
+                      '1y': percent_change['1y'],
+                      'ytd': ytd,
+                      '6m': percent_change['6m'],
+                      '1m': percent_change['1m'],
+                      '5d': percent_change['5d']}
+
+    #TTM/AVERAGES =================================================================
+    stats = {
+        'eod': eod,
+        'ttm high': _trailing_extreme(high, ttm_window, np.fmax),
+        'ttm low': _trailing_extreme(low, ttm_window, np.fmin),
+        'percent change': percent_change,
+        'average price': _window_means(raw, price_windows),
+    }
+
+    if volume is not None:
+        stats['average volume'] = _window_means(_as_panel(volume), volume_windows)
+
+    return _squeeze(stats, single)
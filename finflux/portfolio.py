@@ -0,0 +1,104 @@
+from finflux.aio import awaitable
+from finflux.fund import fund
+from finflux.holdings import fetch_holdings, holdings_matrices
+
+import threading
+
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+class InvalidParameterError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+class InvalidSecurityError(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+#------------------------------------------------------------------------------------------
+@awaitable
+class portfolio:
+    def __init__(self, tickers: list = None):
+        self.tickers = list(dict.fromkeys(tickers or []))
+
+        #fund holdings are fetched once; the matrices are rebuilt only when new funds appear,
+        #so re-weighting the same funds is a sparse product over cached arrays
+        self._fetched = {}
+        self._matrices = None
+        self._lock = threading.Lock()
+
+    def help(self):
+        output = '''
+class portfolio():
+ |  lookthrough()-----------Aggregate single-stock or sector exposure of weighted fund holdings
+ |      weights     :dict       =           [{TICKER*: FLOAT*}]
+ |      by          :str        =holding    [holding, sector]
+ |      display     :str        =json       [json, table]
+ |      -----api(s): yfinance
+'''
+
+        print(output)
+#------------------------------------------------------------------------------------------
+    def _load(self, tickers: list):
+        with self._lock:
+            missing = [ticker for ticker in dict.fromkeys(tickers) if ticker not in self._fetched]
+            if not missing:
+                return self._matrices
+
+            invalid = [ticker for ticker, valid in fund.validate(missing).items() if not valid]
+            if invalid:
+                raise InvalidSecurityError(f"Invalid security type for {', '.join(invalid)}. "
+                                           f"Please select valid '{fund.security_type_1}' or '{fund.security_type_2}' symbols")
+
+            self._fetched.update(fetch_holdings(missing))
+            self._matrices = holdings_matrices(self._fetched)
+            return self._matrices
+#------------------------------------------------------------------------------------------
+    def lookthrough(self, weights: dict, by: str = 'holding', display: str = 'json'):
+        valid_params = {'valid_by': ['holding', 'sector'],
+                        'valid_display': ['json', 'table']}
+
+        params = {'by': by,
+                  'display': display}
+
+        for param_key, param_value, valid_param in zip(params.keys(), params.values(), valid_params.values()):
+            if param_value not in valid_param:
+                raise InvalidParameterError(f"Invalid {param_key} parameter '{param_value}'. "
+                                            f"Please choose a valid parameter: {', '.join(valid_param)}")
+
+        if not isinstance(weights, dict) or not weights:
+            raise InvalidParameterError(f"Invalid weights parameter '{weights}'. "
+                                        f"Please choose a non-empty dict of fund ticker: weight")
+
+        #RAW DATA/OBSERVATIONS-------------------------------------------------------------
+        matrices = self._load(self.tickers + list(weights))
+        #----------------------------------------------------------------------------------
+
+        fund_weights = np.zeros(len(matrices.funds))
+        for ticker, weight in weights.items():
+            fund_weights[matrices.fund_index[ticker]] += weight
+
+        #PARAMETER - BY ===================================================================
+        if by == 'holding':
+            exposure = matrices.holding_matrix.tmatvec(fund_weights)
+            labels = matrices.holdings
+        elif by == 'sector':
+            exposure = matrices.sector_matrix.tmatvec(fund_weights)
+            labels = matrices.sectors
+
+        #largest exposure first, positions the weighted funds do not hold are left out
+        order = np.argsort(-exposure, kind='stable')
+        order = order[exposure[order] != 0]
+
+        #PARAMETER - DISPLAY ==============================================================
+        if display == 'json':
+            output = {labels[i]: float(exposure[i]) for i in order}
+            return output
+        elif display == 'table':
+            if by == 'holding':
+                output = pd.DataFrame({'Name': [matrices.names[i] for i in order], 'Exposure': exposure[order]},
+                                      index=pd.Index([labels[i] for i in order], name='Symbol'))
+            elif by == 'sector':
+                output = pd.DataFrame({'Exposure': exposure[order]}, index=pd.Index([labels[i] for i in order], name='Sector'))
+            return output
@@ -0,0 +1,83 @@
+from finflux.base_var import Config
+from finflux.transport import fan_out
+from finflux.cache import atomic_write
+
+import json
+import os
+import threading
+import time
+
+import yfinance as yf # type: ignore
+
+#------------------------------------------------------------------------------------------
+#sector and industry almost never change, so a profile is trusted for a week
+profile_ttl = 7 * 86400
+profile_fields = ('sector', 'industry')
+
+#------------------------------------------------------------------------------------------
+class profile_cache:
+    #symbol -> slow moving yfinance info fields, kept in memory and in one json file on disk
+    def __init__(self):
+        self._profiles = None
+        self._profiles_dir = None
+        self._lock = threading.Lock()
+#------------------------------------------------------------------------------------------
+    def _path(self):
+        return os.path.join(Config.cache_dir, 'profiles', 'profiles.json')
+
+    def _load(self):
+        if self._profiles is not None and self._profiles_dir == Config.cache_dir:
+            return
+
+        self._profiles = {}
+        self._profiles_dir = Config.cache_dir
+        if Config.cache:
+            try:
+                with open(self._path(), 'r') as file:
+                    self._profiles = json.load(file)
+            except (OSError, ValueError):
+                pass
+
+    def _write(self):
+        if not Config.cache:
+            return
+
+        with atomic_write(self._path()) as file:
+            json.dump(self._profiles, file)
+#------------------------------------------------------------------------------------------
+    def _fetch(self, symbol: str):
+        try:
+            info = yf.Ticker(symbol).get_info()
+        except Exception:
+            #failed lookups are shown as missing and retried on the next call
+            return None
+
+        profile = {field: info.get(field, '-') for field in profile_fields}
+        profile['fetched'] = time.time()
+        return profile
+
+    def get_many(self, symbols: list):
+        symbols = list(dict.fromkeys(symbols))
+        now = time.time()
+
+        with self._lock:
+            self._load()
+            missing = [symbol for symbol in symbols
+                       if symbol not in self._profiles or now - self._profiles[symbol]['fetched'] >= profile_ttl]
+
+        #only symbols without a fresh profile reach yfinance, concurrently across the worker pool
+        if missing:
+            fetched = fan_out(self._fetch, missing)
+            with self._lock:
+                self._profiles.update({symbol: profile for symbol, profile in zip(missing, fetched) if profile is not None})
+                self._write()
+
+        with self._lock:
+            empty = {field: '-' for field in profile_fields}
+            return {symbol: self._profiles.get(symbol, empty) for symbol in symbols}
+
+    def get(self, symbol: str):
+        return self.get_many([symbol])[symbol]
+
+#------------------------------------------------------------------------------------------
+profiles = profile_cache()
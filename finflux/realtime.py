@@ -0,0 +1,56 @@
+from finflux.base_var import Config
+from finflux.transport import transport, fan_out
+
+import threading
+
+import numpy as np # type: ignore
+
+#------------------------------------------------------------------------------------------
+#Twelve Data accepts up to 120 comma separated symbols per price/quote request, but bills one
+#credit per symbol, so a batch is also kept within the td rate limit (8 per minute by default)
+batch_size = 120
+
+#symbol -> trading currency, which does not change between realtime calls
+_currencies = {}
+_lock = threading.Lock()
+
+#------------------------------------------------------------------------------------------
+def _batch(endpoint: str, symbols: list):
+    url = Config.td_baseurl + f"{endpoint}?apikey={Config.td_apikey}&symbol={','.join(symbols)}"
+    data = transport.get(url, cost=len(symbols)).json()
+
+    #a single symbol comes back unwrapped, a batch is keyed by symbol
+    if len(symbols) == 1:
+        data = {symbols[0]: data}
+
+    return {symbol: data.get(symbol, {}) for symbol in symbols}
+
+def _batches(endpoint: str, symbols: list):
+    symbols = list(dict.fromkeys(symbols))
+
+    size = min([batch_size] + [calls for calls, _ in Config.rate_limits.get('td') or []])
+    chunks = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+
+    results = {}
+    for result in fan_out(lambda chunk: _batch(endpoint, chunk), chunks):
+        results.update(result)
+    return results
+
+#------------------------------------------------------------------------------------------
+def realtime_prices(symbols: list):
+    #{symbol: latest price}, NaN for symbols Twelve Data rejected
+    return {symbol: float(data['price']) if 'price' in data else np.nan
+            for symbol, data in _batches('price', symbols).items()}
+
+def realtime_currencies(symbols: list):
+    #{symbol: currency}, only symbols never seen before cost a quote request
+    with _lock:
+        missing = [symbol for symbol in dict.fromkeys(symbols) if symbol not in _currencies]
+
+    if missing:
+        found = {symbol: data['currency'] for symbol, data in _batches('quote', missing).items() if 'currency' in data}
+        with _lock:
+            _currencies.update(found)
+
+    with _lock:
+        return {symbol: _currencies.get(symbol, '-') for symbol in symbols}
@@ -0,0 +1,13 @@
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+def render(frame: pd.DataFrame, spec: str, missing: str = 'nan'):
+    #formatting a numeric frame for display in one pass over its values; only run when a table is asked for
+    values = frame.to_numpy(dtype=float, na_value=np.nan)
+    empty = np.isnan(values)
+
+    text = np.frompyfunc(spec.format, 1, 1)(np.where(empty, 0, values))
+    text[empty] = missing
+
+    return pd.DataFrame(text, index=frame.index, columns=frame.columns)
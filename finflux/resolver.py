@@ -0,0 +1,40 @@
+import yfinance as yf # type: ignore
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+
+#------------------------------------------------------------------------------------------
+class price_resolver:
+    #one history download answering "last close on or before date D" for any number of dates
+    def __init__(self, ticker: str, start: str = None):
+        self.ticker = ticker
+
+        if start is None:
+            history = yf.Ticker(ticker).history(period='max')
+        else:
+            history = yf.Ticker(ticker).history(start=start)
+
+        history = history[history['Close'].notna()]
+
+        #exchange local calendar dates, so fiscal period ends compare day to day
+        self.dates = history.index.tz_localize(None).normalize().to_numpy() if history.index.tz is not None else history.index.normalize().to_numpy()
+        self.closes = history['Close'].to_numpy(dtype=float)
+
+    def latest(self):
+        return float(self.closes[-1]) if len(self.closes) else np.nan
+
+    def asof(self, dates, tolerance: int = None):
+        #tolerance: the most calendar days the matched close may precede its date (None for any)
+        targets = pd.DatetimeIndex(pd.to_datetime(list(dates))).tz_localize(None).normalize().to_numpy()
+
+        positions = np.searchsorted(self.dates, targets, side='right') - 1
+        found = positions >= 0
+
+        prices = np.full(len(targets), np.nan)
+        prices[found] = self.closes[positions[found]]
+
+        if tolerance is not None:
+            lag = np.full(len(targets), np.timedelta64('NaT'), dtype='timedelta64[ns]')
+            lag[found] = targets[found] - self.dates[positions[found]]
+            prices[~(lag <= np.timedelta64(tolerance, 'D'))] = np.nan
+
+        return prices
@@ -0,0 +1,120 @@
+from finflux.base_var import Config
+
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+#------------------------------------------------------------------------------------------
+class RateLimitError(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+#------------------------------------------------------------------------------------------
+_local = threading.local()
+
+def current_priority():
+    return getattr(_local, 'priority', 0)
+
+@contextmanager
+def priority(level: int):
+    #lower levels are served first; batch jobs can run under e.g. priority(10) to yield to
+    #interactive calls that share the same provider quota
+    previous = current_priority()
+    _local.priority = level
+    try:
+        yield
+    finally:
+        _local.priority = previous
+
+#------------------------------------------------------------------------------------------
+class TokenBucket:
+    def __init__(self, calls: int, seconds: float):
+        self.capacity = calls
+        self.rate = calls / seconds
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, cost: float = 1):
+        return 0 if self.tokens >= cost else (cost - self.tokens) / self.rate
+
+#------------------------------------------------------------------------------------------
+class Scheduler:
+    #One priority queue per provider in front of that provider's token buckets. A request
+    #only leaves the queue once it is at the head and every bucket (e.g. BLS per-10s and
+    #per-day) has a token, so bursts are paced instead of turning into 429s.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._providers = {}
+        self._counter = itertools.count()
+
+    def _state(self, provider: str, limits: list):
+        with self._lock:
+            state = self._providers.get(provider)
+            if state is None or state['limits'] != limits:
+                state = {
+                    'limits': limits,
+                    'buckets': [TokenBucket(calls, seconds) for calls, seconds in limits],
+                    'queue': [],
+                    'condition': threading.Condition()
+                }
+                self._providers[provider] = state
+            return state
+#------------------------------------------------------------------------------------------
+    def acquire(self, provider: str, level: int = None, cost: int = 1):
+        #cost is the number of provider credits the request is billed (Twelve Data bills batch
+        #requests per symbol); it is capped at each bucket's capacity so it can always be met.
+        #A wait longer than Config.max_wait seconds (e.g. call 26 of Alpha Vantage's 25 per day)
+        #raises RateLimitError instead of blocking the caller
+        limits = Config.rate_limits.get(provider)
+        if not limits:
+            return
+
+        state = self._state(provider, limits)
+        ticket = (current_priority() if level is None else level, next(self._counter))
+
+        with state['condition']:
+            heapq.heappush(state['queue'], ticket)
+
+            while True:
+                if state['queue'][0] == ticket:
+                    now = time.monotonic()
+                    for bucket in state['buckets']:
+                        bucket.refill(now)
+
+                    wait = max(bucket.wait_time(min(cost, bucket.capacity)) for bucket in state['buckets'])
+                    if Config.max_wait is not None and wait > Config.max_wait:
+                        heapq.heappop(state['queue'])
+                        state['condition'].notify_all()
+                        raise RateLimitError(f"Rate limit for provider '{provider}' reached, the next call is allowed in {wait:,.0f}s. "
+                                             f"Raise the limits for a paid plan with set_config(rate_limits={{'{provider}': [(CALLS, SECONDS)]}})")
+                    if wait == 0:
+                        for bucket in state['buckets']:
+                            bucket.tokens -= min(cost, bucket.capacity)
+                        heapq.heappop(state['queue'])
+                        state['condition'].notify_all()
+                        return
+
+                    state['condition'].wait(wait)
+                else:
+                    state['condition'].wait()
+
+    def penalize(self, provider: str, seconds: float):
+        #draining a provider's buckets after a 429 so queued requests back off together
+        limits = Config.rate_limits.get(provider)
+        if not limits:
+            return
+
+        state = self._state(provider, limits)
+        with state['condition']:
+            for bucket in state['buckets']:
+                bucket.refill(time.monotonic())
+                bucket.tokens = min(bucket.tokens, 1 - seconds * bucket.rate)
+
+#------------------------------------------------------------------------------------------
+scheduler = Scheduler()
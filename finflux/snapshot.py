@@ -0,0 +1,87 @@
+from finflux.base_var import Config
+
+import threading
+import time
+
+import yfinance as yf # type: ignore
+
+#------------------------------------------------------------------------------------------
+class financial_snapshot:
+    #raw yfinance statement frames for every (statement, interval) pair
+    frames = {('income', 'annual'): 'income_stmt',
+              ('income', 'quarter'): 'quarterly_income_stmt',
+              ('balance', 'annual'): 'balance_sheet',
+              ('balance', 'quarter'): 'quarterly_balance_sheet',
+              ('cash', 'annual'): 'cash_flow',
+              ('cash', 'quarter'): 'quarterly_cash_flow'}
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.firm = yf.Ticker(ticker)
+
+        #each frame and the info dict are fetched on first use and then shared
+        self._frames = {}
+        self._info = None
+        self._lock = threading.Lock()
+
+    def statement(self, statement: str, interval: str = 'annual'):
+        key = (statement, interval)
+
+        with self._lock:
+            if key not in self._frames:
+                self._frames[key] = getattr(self.firm, financial_snapshot.frames[key])
+
+        #callers add derived line items, so they get their own numeric copy
+        return self._frames[key].copy()
+
+    def info(self):
+        with self._lock:
+            if self._info is None:
+                self._info = self.firm.get_info()
+
+        return self._info
+
+#------------------------------------------------------------------------------------------
+class fund_profile:
+    #one yfinance Ticker per fund with its info dict and funds data fetched once; with
+    #set_config(fund_profile_ttl=...) both are also shared across instances for that many seconds
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.firm = yf.Ticker(ticker)
+
+        self._parts = {}
+        self._lock = threading.Lock()
+
+    def _part(self, name: str, fetch):
+        key = (self.ticker, name)
+
+        with self._lock:
+            if name not in self._parts:
+                shared = None
+                if Config.fund_profile_ttl:
+                    with fund_profile._shared_lock:
+                        shared = fund_profile._shared.get(key)
+
+                if shared is not None and time.time() - shared[0] < Config.fund_profile_ttl:
+                    self._parts[name] = shared[1]
+                else:
+                    self._parts[name] = fetch()
+                    if Config.fund_profile_ttl:
+                        with fund_profile._shared_lock:
+                            #expired entries are dropped as new ones come in, so the cache only
+                            #holds funds looked up within the last window
+                            now = time.time()
+                            fund_profile._shared = {shared_key: entry for shared_key, entry in fund_profile._shared.items()
+                                                    if now - entry[0] < Config.fund_profile_ttl}
+                            fund_profile._shared[key] = (now, self._parts[name])
+
+        return self._parts[name]
+
+    def info(self):
+        return self._part('info', self.firm.get_info)
+
+    def funds_data(self):
+        return self._part('funds data', self.firm.get_funds_data)
@@ -0,0 +1,183 @@
+from finflux.base_var import Config
+from finflux.cache import atomic_write
+
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import quote
+
+import numpy as np # type: ignore
+import pandas as pd # type: ignore
+import yfinance as yf # type: ignore
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+#------------------------------------------------------------------------------------------
+#one fixed size record per bar, so a file grows by appending and any bar is found by offset
+record = np.dtype([('date', '<i8'), ('close', '<f8'), ('high', '<f8'), ('low', '<f8'), ('open', '<f8'), ('volume', '<i8')])
+fields = ['Close', 'High', 'Low', 'Open', 'Volume']
+actions = ['Dividends', 'Stock Splits']
+
+#------------------------------------------------------------------------------------------
+class price_store:
+    #Append-only OHLCV history per symbol and interval under <cache_dir>/prices, switched on
+    #with set_config(price_store=True). An update downloads, for all requested symbols at once,
+    #the bars from each second to last stored bar on: that bar must come back unchanged (else
+    #the history was re-adjusted), the last bar may have been partial and is replaced, and a
+    #split or dividend on a bar not stored yet means that symbol's whole history is downloaded
+    #again (one on a stored bar is already part of its adjustment).
+    download_chunk = 100
+
+    def __init__(self):
+        self._lock = threading.Lock()
+#------------------------------------------------------------------------------------------
+    def _path(self, ticker: str, interval: str):
+        return os.path.join(Config.cache_dir, 'prices', interval, f"{quote(ticker, safe='')}.bin")
+
+    @contextmanager
+    def _file_lock(self, path: str):
+        #exclusive lock on a sidecar file, so processes sharing the cache directory never see
+        #a file halfway through an append
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.lock', 'a+b') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _count(self, path: str):
+        try:
+            return os.path.getsize(path) // record.itemsize
+        except OSError:
+            return 0
+
+    def _tail(self, path: str, count: int, n: int):
+        #only the last n bars are mapped, not the whole file
+        tail = np.memmap(path, dtype=record, mode='r', offset=(count - n) * record.itemsize, shape=(n,))
+        output = np.array(tail)
+        del tail
+        return output
+#------------------------------------------------------------------------------------------
+    def _download(self, tickers: list, interval: str, start: str = None):
+        #{ticker: OHLCV + actions frame} from chunked multi-symbol downloads
+        output = {}
+        for i in range(0, len(tickers), price_store.download_chunk):
+            chunk = tickers[i:i + price_store.download_chunk]
+            if start is None:
+                raw = yf.download(chunk, period='max', interval=interval, auto_adjust=True, actions=True, ignore_tz=True, group_by='ticker', progress=False, threads=True)
+            else:
+                raw = yf.download(chunk, start=start, interval=interval, auto_adjust=True, actions=True, ignore_tz=True, group_by='ticker', progress=False, threads=True)
+
+            for ticker in chunk:
+                if isinstance(raw.columns, pd.MultiIndex) and ticker in raw.columns.get_level_values(0):
+                    history = raw[ticker]
+                elif not isinstance(raw.columns, pd.MultiIndex) and len(chunk) == 1:
+                    history = raw
+                else:
+                    history = pd.DataFrame(columns=fields + actions)
+                #the panel has a row for every date any symbol traded
+                output[ticker] = history.reindex(columns=fields + actions).dropna(subset=['Close'])
+
+        return output
+
+    def _records(self, history: pd.DataFrame):
+        index = pd.DatetimeIndex(history.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        output = np.empty(len(history), dtype=record)
+        output['date'] = index.as_unit('ns').asi8
+        for field in fields:
+            values = history[field].to_numpy(dtype=float)
+            output[field.lower()] = np.nan_to_num(values).astype('int64') if field == 'Volume' else values
+        return output
+
+    def _rewrite(self, path: str, records: np.ndarray):
+        with atomic_write(path, 'wb') as file:
+            records.tofile(file)
+
+    def _append(self, path: str, keep: int, records: np.ndarray):
+        with open(path, 'r+b') as file:
+            file.truncate(keep * record.itemsize)
+            file.seek(0, os.SEEK_END)
+            file.write(records.tobytes())
+#------------------------------------------------------------------------------------------
+    def _update(self, tickers: list, interval: str):
+        paths = {ticker: self._path(ticker, interval) for ticker in tickers}
+        counts = {ticker: self._count(paths[ticker]) for ticker in tickers}
+
+        full = [ticker for ticker in tickers if counts[ticker] < 2]
+        stored = [ticker for ticker in tickers if counts[ticker] >= 2]
+
+        if stored:
+            tails = {ticker: self._tail(paths[ticker], counts[ticker], 2) for ticker in stored}
+            start = min(pd.Timestamp(tail[0]['date']) for tail in tails.values())
+            fresh = self._download(stored, interval, start=str(start.date()))
+
+            for ticker in stored:
+                check, last = tails[ticker]
+                history = fresh[ticker]
+                records = self._records(history)
+
+                keep = records['date'] >= check['date']
+                history, records = history[keep], records[keep]
+                after = records['date'] > check['date']
+
+                unchanged = (len(records) > 0 and records['date'][0] == check['date']
+                             and np.isclose(records['close'][0], check['close'], rtol=1e-6, equal_nan=True))
+                #an action on a stored bar was part of the adjustment when it was written; had it
+                #changed the history since, the check bar would not have come back unchanged
+                adjusted = history[actions].fillna(0).to_numpy()[records['date'] > last['date']].any()
+
+                if not unchanged or adjusted:
+                    full.append(ticker)
+                    continue
+
+                if after.any():
+                    with self._file_lock(paths[ticker]):
+                        #another process may have brought the file forward in the meantime
+                        if self._count(paths[ticker]) == counts[ticker]:
+                            self._append(paths[ticker], counts[ticker] - 1, records[after])
+
+        if full:
+            fetched = self._download(full, interval)
+            for ticker in full:
+                if not fetched[ticker].empty:
+                    with self._file_lock(paths[ticker]):
+                        self._rewrite(paths[ticker], self._records(fetched[ticker]))
+
+    def histories(self, tickers: list, interval: str = '1d'):
+        #{ticker: full stored (date x Close, High, Low, Open, Volume) frame}, brought up to date first
+        tickers = list(dict.fromkeys(tickers))
+
+        with self._lock:
+            self._update(tickers, interval)
+
+            output = {}
+            for ticker in tickers:
+                path = self._path(ticker, interval)
+                with self._file_lock(path):
+                    stored = np.fromfile(path, dtype=record) if self._count(path) > 0 else np.empty(0, dtype=record)
+
+                output[ticker] = pd.DataFrame({field: stored[field.lower()] for field in fields},
+                                              index=pd.DatetimeIndex(stored['date'].astype('datetime64[ns]'), name='Date'))
+        return output
+
+    def history(self, ticker: str, interval: str = '1d'):
+        return self.histories([ticker], interval)[ticker]
+
+#------------------------------------------------------------------------------------------
+prices = price_store()
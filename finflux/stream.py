@@ -0,0 +1,223 @@
+from finflux.base_var import Config
+
+import asyncio
+import json
+import threading
+import time
+
+import numpy as np # type: ignore
+
+#------------------------------------------------------------------------------------------
+class InvalidParameterError(Exception):
+    def __init__(self, msg):
+        self.msg = msg
+
+class MissingConfigObject(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+class MissingDependencyError(Exception):
+    def __init__(self, msg: str):
+        self.msg = msg
+
+#------------------------------------------------------------------------------------------
+#Twelve Data closes price streams that have not sent a heartbeat for a while
+heartbeat_seconds = 10
+heartbeat_message = json.dumps({'action': 'heartbeat'})
+
+def _websockets():
+    #websockets is an optional dependency (pip install finflux[stream]), only needed for streaming
+    try:
+        from websockets.sync.client import connect as sync_connect # type: ignore
+        from websockets.asyncio.client import connect as async_connect # type: ignore
+        from websockets.exceptions import ConnectionClosed # type: ignore
+    except ImportError:
+        raise MissingDependencyError('Missing websockets package. Please install it using: pip install finflux[stream]')
+
+    return sync_connect, async_connect, ConnectionClosed
+
+#------------------------------------------------------------------------------------------
+class tick_buffer:
+    #fixed size ring of the most recent (timestamp, price) ticks for one symbol
+    def __init__(self, size: int):
+        self._timestamps = np.full(size, np.nan)
+        self._prices = np.full(size, np.nan)
+        self._next = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def push(self, timestamp: float, price: float):
+        with self._lock:
+            self._timestamps[self._next] = timestamp
+            self._prices[self._next] = price
+            self._next = (self._next + 1) % len(self._prices)
+            self._count = min(self._count + 1, len(self._prices))
+
+    def latest(self):
+        with self._lock:
+            if self._count == 0:
+                return np.nan, np.nan
+            return self._timestamps[self._next - 1], self._prices[self._next - 1]
+
+    def snapshot(self):
+        #copies of the buffered ticks, oldest first
+        with self._lock:
+            order = np.arange(self._next - self._count, self._next) % len(self._prices)
+            return self._timestamps[order], self._prices[order]
+
+#------------------------------------------------------------------------------------------
+class stream:
+    def __init__(self, symbols: list, history: int = 1000):
+        if Config.td_apikey is None:
+            raise MissingConfigObject('Missing td_apikey. Please set your Twelve Data api key using the set_config() function.')
+
+        if not isinstance(history, int) or history < 1:
+            raise InvalidParameterError(f"Invalid history parameter '{history}'. "
+                                        f"Please choose a positive integer.")
+
+        self.symbols = list(dict.fromkeys(symbols))
+        self.history = history
+
+        self.subscribed = []
+        self.failed = []
+
+        self._buffers = {symbol: tick_buffer(history) for symbol in self.symbols}
+        self._lock = threading.Lock()
+        self._connection = None
+        self._closed = False
+
+    def help(self):
+        output = '''
+class stream():
+ |  __iter__()--------------Blocking iteration over price ticks: for tick in stream(...)
+ |      -----api(s): twelve data
+ |
+ |  __aiter__()-------------Async iteration over price ticks: async for tick in stream(...)
+ |      -----api(s): twelve data
+ |
+ |  latest()----------------Most recent streamed (timestamp, price) of a symbol
+ |      symbol      :str        =           [SYMBOL*]
+ |
+ |  snapshot()--------------Buffered (timestamps, prices) arrays of a symbol, oldest first
+ |      symbol      :str        =           [SYMBOL*]
+ |
+ |  close()-----------------Close the WebSocket and end iteration
+'''
+
+        print(output)
+#------------------------------------------------------------------------------------------
+    def _url(self):
+        return f'{Config.td_wsurl}?apikey={Config.td_apikey}'
+
+    def _buffer(self, symbol: str):
+        with self._lock:
+            if symbol not in self._buffers:
+                self._buffers[symbol] = tick_buffer(self.history)
+            return self._buffers[symbol]
+
+    def _handle(self, message):
+        #price events are buffered and handed back as ticks, status and heartbeat replies are not
+        event = json.loads(message)
+
+        if event.get('event') == 'price':
+            self._buffer(event['symbol']).push(float(event['timestamp']), float(event['price']))
+            return event
+
+        if event.get('event') == 'subscribe-status':
+            self.subscribed += [item['symbol'] for item in event.get('success') or []]
+            self.failed += [item['symbol'] for item in event.get('fails') or []]
+
+        return None
+
+    def _subscribe(self):
+        #a (re)connect starts a fresh subscription, so its status replaces the previous one
+        self.subscribed, self.failed = [], []
+        return json.dumps({'action': 'subscribe', 'params': {'symbols': ','.join(self.symbols)}})
+#------------------------------------------------------------------------------------------
+    def __iter__(self):
+        sync_connect, _, ConnectionClosed = _websockets()
+
+        attempts = 0
+        while not self._closed:
+            try:
+                with sync_connect(self._url()) as connection:
+                    self._connection = connection
+                    connection.send(self._subscribe())
+
+                    next_heartbeat = time.monotonic() + heartbeat_seconds
+                    while True:
+                        try:
+                            message = connection.recv(timeout=max(next_heartbeat - time.monotonic(), 0))
+                        except TimeoutError:
+                            message = None
+
+                        if time.monotonic() >= next_heartbeat:
+                            connection.send(heartbeat_message)
+                            next_heartbeat = time.monotonic() + heartbeat_seconds
+
+                        tick = self._handle(message) if message is not None else None
+                        if tick is not None:
+                            attempts = 0
+                            yield tick
+            except (ConnectionClosed, OSError):
+                #a dropped connection is reopened with backoff, giving up after max_retries failures in a row
+                attempts += 1
+                if self._closed:
+                    return
+                if attempts > Config.max_retries:
+                    raise
+                time.sleep(min(2 ** (attempts - 1), 30))
+            finally:
+                self._connection = None
+
+    async def __aiter__(self):
+        _, async_connect, ConnectionClosed = _websockets()
+
+        attempts = 0
+        while not self._closed:
+            try:
+                async with async_connect(self._url()) as connection:
+                    await connection.send(self._subscribe())
+
+                    next_heartbeat = time.monotonic() + heartbeat_seconds
+                    while not self._closed:
+                        try:
+                            message = await asyncio.wait_for(connection.recv(), max(next_heartbeat - time.monotonic(), 0))
+                        except asyncio.TimeoutError:
+                            message = None
+
+                        if time.monotonic() >= next_heartbeat:
+                            await connection.send(heartbeat_message)
+                            next_heartbeat = time.monotonic() + heartbeat_seconds
+
+                        tick = self._handle(message) if message is not None else None
+                        if tick is not None:
+                            attempts = 0
+                            yield tick
+            except (ConnectionClosed, OSError):
+                attempts += 1
+                if self._closed:
+                    return
+                if attempts > Config.max_retries:
+                    raise
+                await asyncio.sleep(min(2 ** (attempts - 1), 30))
+#------------------------------------------------------------------------------------------
+    def latest(self, symbol: str):
+        return self._buffer(symbol).latest()
+
+    def snapshot(self, symbol: str):
+        return self._buffer(symbol).snapshot()
+
+    def close(self):
+        #safe to call from another thread: a blocked __iter__ wakes up and ends, __aiter__ ends
+        #at its next message or heartbeat
+        self._closed = True
+        connection = self._connection
+        if connection is not None:
+            connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,158 @@
+from finflux.base_var import Config
+from finflux.cache import disk_cache, request_key, expiry, cacheable
+from finflux.scheduler import scheduler, current_priority, priority
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from urllib.parse import urlsplit
+
+import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+
+#------------------------------------------------------------------------------------------
+#provider names match the set_config() keyword of the api key each host uses
+providers = {
+    'api.twelvedata.com': 'td',
+    'www.alphavantage.co': 'av',
+    'api.stlouisfed.org': 'fred',
+    'api.bls.gov': 'bls',
+    'apps.bea.gov': 'bea',
+    'www.sec.gov': 'sec',
+    'data.sec.gov': 'sec',
+}
+
+def provider(url: str):
+    return providers.get(urlsplit(url).netloc.lower())
+
+#------------------------------------------------------------------------------------------
+class Transport:
+    #One keep-alive session per provider host so repeated calls to FRED, BLS, BEA, SEC and
+    #Twelve Data reuse their TCP/TLS connections instead of paying a new handshake each time.
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+        #requests currently on the wire, keyed like the disk cache so identical calls coalesce
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+#------------------------------------------------------------------------------------------
+    def session(self, url: str):
+        host = urlsplit(url).netloc
+
+        with self._lock:
+            pool_size, session = self._sessions.get(host, (None, None))
+
+            #rebuilding the host session if the pool size was changed through set_config()
+            if session is None or pool_size != Config.pool_size:
+                if session is not None:
+                    session.close()
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=Config.pool_size)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                self._sessions[host] = (Config.pool_size, session)
+
+        return session
+#------------------------------------------------------------------------------------------
+    def request(self, method: str, url: str, cost: int = 1, **kwargs):
+        key = request_key(method, url, kwargs.get('params'), kwargs.get('data', kwargs.get('json')))
+
+        #SINGLEFLIGHT (later callers of an identical request wait on the first caller's result)
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._inflight[key] = call
+
+        if not leader:
+            return call.result()
+
+        try:
+            response = self._fetch(method, url, key, cost, **kwargs)
+            call.set_result(response)
+            return response
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _fetch(self, method: str, url: str, key: str, cost: int = 1, **kwargs):
+        url_provider = provider(url)
+        expires = expiry(url_provider, url) if Config.cache else None
+
+        #CACHE LOOKUP (responses with a provider TTL are served from disk until they expire)
+        if expires is not None:
+            cached = disk_cache.get(key)
+            if cached is not None:
+                return cached
+
+        #RATE LIMITING (waiting for a provider token, retrying 429s after the advertised delay)
+        for attempt in range(Config.max_retries + 1):
+            scheduler.acquire(url_provider, cost=cost)
+            response = self.session(url).request(method, url, **kwargs)
+
+            if not self._throttled(url_provider, response) or attempt == Config.max_retries:
+                break
+
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** (attempt + 1)
+            scheduler.penalize(url_provider, delay)
+            if not Config.rate_limits.get(url_provider):
+                time.sleep(delay)
+
+        if expires is not None and cacheable(url_provider, response):
+            disk_cache.put(key, response, expires)
+
+        return response
+
+    def _throttled(self, url_provider: str, response):
+        if response.status_code == 429:
+            return True
+
+        #Twelve Data reports exhausted credits inside a 200 response
+        if url_provider == 'td':
+            try:
+                return response.json().get('code') == 429
+            except (ValueError, AttributeError):
+                return False
+
+        return False
+
+    def get(self, url: str, cost: int = 1, **kwargs):
+        return self.request('GET', url, cost, **kwargs)
+
+    def post(self, url: str, cost: int = 1, **kwargs):
+        return self.request('POST', url, cost, **kwargs)
+#------------------------------------------------------------------------------------------
+    def priority(self, level: int):
+        return priority(level)
+
+    def close(self):
+        with self._lock:
+            for pool_size, session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+#------------------------------------------------------------------------------------------
+transport = Transport()
+#------------------------------------------------------------------------------------------
+def fan_out(func, items, max_workers: int = None):
+    #running independent sub-requests concurrently while keeping the input order of results
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+
+    #worker threads inherit the caller's scheduling priority
+    level = current_priority()
+    def run(item):
+        with priority(level):
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(items), Config.pool_size)) as pool:
+        return list(pool.map(run, items))
@@ -0,0 +1,65 @@
+from finflux.transport import fan_out
+
+import threading
+
+import yfinance as yf # type: ignore
+
+#the batched quote endpoint needs yahoo's cookie/crumb session, which yfinance only exposes
+#through an internal class; without it every symbol goes through the public info lookup
+try:
+    from yfinance.data import YfData # type: ignore
+except ImportError:
+    YfData = None
+
+#------------------------------------------------------------------------------------------
+#Yahoo quote endpoint that accepts a comma separated symbol list and reports each quoteType
+quote_url = 'https://query1.finance.yahoo.com/v7/finance/quote'
+chunk_size = 200
+
+#in-process quoteType per symbol (None for symbols Yahoo does not recognize); lookups that
+#failed are never stored, so a transient error does not mark a symbol invalid
+_quote_types = {}
+_lock = threading.Lock()
+
+#------------------------------------------------------------------------------------------
+def _info_quote_type(symbol: str):
+    #one retry, then the error reaches the caller instead of reading as an unknown symbol
+    try:
+        return yf.Ticker(symbol).get_info().get('quoteType')
+    except Exception:
+        return yf.Ticker(symbol).get_info().get('quoteType')
+
+def _fetch_chunk(symbols: list):
+    output = {}
+    if YfData is not None:
+        try:
+            response = YfData().get_raw_json(quote_url, params={'symbols': ','.join(symbols), 'formatted': 'false'})
+            #yahoo answers with upper case symbols, results are mapped back to the requested spelling
+            found = {quote['symbol'].upper(): quote.get('quoteType') for quote in response['quoteResponse']['result']}
+            output = {symbol: found[symbol.upper()] for symbol in symbols if symbol.upper() in found}
+        except Exception:
+            pass
+
+    #one info lookup per symbol the batched endpoint is unavailable for or left out of a
+    #(possibly partial) response, rather than reading the omission as an unknown symbol
+    missing = [symbol for symbol in symbols if symbol not in output]
+    output.update(zip(missing, fan_out(_info_quote_type, missing)))
+    return output
+
+def quote_types(symbols: list):
+    symbols = list(dict.fromkeys(symbols))
+
+    with _lock:
+        missing = [symbol for symbol in symbols if symbol not in _quote_types]
+
+    if missing:
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        for found in fan_out(_fetch_chunk, chunks):
+            with _lock:
+                _quote_types.update(found)
+
+    with _lock:
+        return {symbol: _quote_types[symbol] for symbol in symbols}
+
+def quote_type(symbol: str):
+    return quote_types([symbol])[symbol]
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from finflux.cache import atomic_write
+
+#------------------------------------------------------------------------------------------
+def test_atomic_write(tmp_path):
+    path = str(tmp_path / 'nested' / 'state.json')
+
+    with atomic_write(path) as file:
+        file.write('first')
+    assert open(path).read() == 'first'
+
+    #a write that fails halfway leaves the previous file and no temporary file behind
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as file:
+            file.write('sec')
+            raise RuntimeError('interrupted')
+
+    assert open(path).read() == 'first'
+    assert os.listdir(tmp_path / 'nested') == ['state.json']
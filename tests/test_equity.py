@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+equity = __import__('finflux.equity', fromlist=['equity']).equity
+
+#------------------------------------------------------------------------------------------
+@pytest.fixture
+def statements(monkeypatch):
+    #stand-in statement frames per ticker: AAPL has a repeated fiscal year label after a
+    #year-end change, MSFT is missing a line item and reports one period fewer
+    frames = {
+        'AAPL': pd.DataFrame([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]],
+                             index=['Total Revenue', 'Net Income'], columns=['FY 2025', 'FY 2024', 'FY 2024']),
+        'MSFT': pd.DataFrame([[7.0, 8.0], [9.0, 10.0]],
+                             index=['Total Revenue', 'EBIT'], columns=['FY 2025', 'FY 2023']),
+    }
+    monkeypatch.setattr(equity, 'validate', classmethod(lambda cls, tickers: {ticker: True for ticker in tickers}))
+    monkeypatch.setattr(equity, '_statement_frame', lambda self, **kwargs: frames[self.ticker].copy())
+    return frames
+
+#------------------------------------------------------------------------------------------
+def test_cube_aligns_items_and_periods(statements):
+    output = equity.statement_panel(['AAPL', 'MSFT'], layout='cube')
+
+    assert output['tickers'] == ['AAPL', 'MSFT']
+    assert output['items'] == ['Total Revenue', 'Net Income', 'EBIT']
+    assert output['periods'] == ['FY 2025', 'FY 2024', 'FY 2023']
+    assert output['data'].shape == (2, 3, 3)
+
+    #the latest of the repeated FY 2024 columns is kept
+    np.testing.assert_array_equal(output['data'][0], [[1, 2, np.nan], [4, 5, np.nan], [np.nan, np.nan, np.nan]])
+    np.testing.assert_array_equal(output['data'][1], [[7, np.nan, 8], [np.nan, np.nan, np.nan], [9, np.nan, 10]])
+
+def test_frame_matches_cube(statements):
+    frame = equity.statement_panel(['AAPL', 'MSFT'])
+    cube = equity.statement_panel(['AAPL', 'MSFT'], layout='cube')
+
+    assert list(frame.columns) == cube['periods']
+    assert frame.loc[('MSFT', 'EBIT'), 'FY 2023'] == 10.0
+    np.testing.assert_array_equal(frame.to_numpy().reshape(cube['data'].shape), cube['data'])
@@ -0,0 +1,79 @@
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.holdings import sparse_matrix
+from finflux.transport import fan_out
+
+holdings = sys.modules['finflux.holdings']
+
+#------------------------------------------------------------------------------------------
+def random_sparse(seed, shape, density):
+    #sparse_matrix and its dense equivalent, entries sorted by row like holdings_matrices builds them
+    rng = np.random.default_rng(seed)
+    dense = np.where(rng.random(shape) < density, rng.random(shape), 0.0)
+    rows, cols = np.nonzero(dense)
+    return sparse_matrix(rows, cols, dense[rows, cols], shape), dense
+
+def dense_min_gram(dense):
+    n = dense.shape[0]
+    return np.array([[np.minimum(dense[i], dense[j]).sum() for j in range(n)] for i in range(n)])
+
+#------------------------------------------------------------------------------------------
+@pytest.mark.parametrize('seed, shape, density', [(0, (1, 1), 1.0), (1, (5, 8), 0.4), (2, (12, 30), 0.2), (3, (7, 4), 0.9), (4, (6, 10), 0.05)])
+def test_matches_dense(seed, shape, density):
+    matrix, dense = random_sparse(seed, shape, density)
+    vector = np.random.default_rng(seed).random(shape[0])
+
+    np.testing.assert_allclose(matrix.tmatvec(vector), dense.T @ vector)
+    np.testing.assert_allclose(matrix.min_gram(), dense_min_gram(dense))
+
+@pytest.mark.parametrize('shape', [(0, 0), (0, 3), (2, 0), (2, 3)])
+def test_empty(shape):
+    matrix = sparse_matrix([], [], [], shape)
+
+    exposure = matrix.tmatvec(np.ones(shape[0]))
+    assert exposure.dtype == float and exposure.shape == (shape[1],)
+    assert not exposure.any()
+
+    gram = matrix.min_gram()
+    assert gram.dtype == float and gram.shape == (shape[0], shape[0])
+    assert not gram.any()
+
+#------------------------------------------------------------------------------------------
+@pytest.fixture
+def downloads(monkeypatch):
+    #stand-in for yf.download: a slow six month panel rising 50%, recording each call's symbols
+    calls = []
+
+    def download(symbols, period=None, **kwargs):
+        calls.append(sorted(symbols))
+        time.sleep(0.3)
+        index = pd.bdate_range('2026-04-01', periods=120)
+        close = pd.DataFrame({symbol: np.linspace(100, 150, len(index)) for symbol in symbols}, index=index)
+        return pd.concat({'Close': close}, axis=1)
+
+    monkeypatch.setattr(holdings.yf, 'download', download)
+    monkeypatch.setattr(holdings, '_returns', {})
+    monkeypatch.setattr(holdings, '_returns_inflight', {})
+    return calls
+
+def test_six_month_returns_download_concurrently(downloads):
+    started = time.monotonic()
+    results = fan_out(holdings.six_month_returns, [['AAPL', 'MSFT'], ['NVDA'], ['AAPL', 'AMZN']])
+    elapsed = time.monotonic() - started
+
+    assert results == [{'AAPL': pytest.approx(0.5), 'MSFT': pytest.approx(0.5)}, {'NVDA': pytest.approx(0.5)},
+                       {'AAPL': pytest.approx(0.5), 'AMZN': pytest.approx(0.5)}]
+
+    #every symbol was downloaded once, and unrelated downloads did not queue behind each other
+    downloaded = [symbol for symbols in downloads for symbol in symbols]
+    assert sorted(downloaded) == ['AAPL', 'AMZN', 'MSFT', 'NVDA']
+    assert elapsed < 0.55
+
+    #served from the cache within the window
+    assert holdings.six_month_returns(['NVDA', 'MSFT']) == {'NVDA': pytest.approx(0.5), 'MSFT': pytest.approx(0.5)}
+    assert len(downloads) == 3
@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from finflux.base_var import Config
+from finflux.scheduler import Scheduler, RateLimitError
+
+#------------------------------------------------------------------------------------------
+def test_daily_quota_raises_instead_of_blocking(monkeypatch):
+    monkeypatch.setattr(Config, 'rate_limits', {'av': [(2, 86400)]})
+    monkeypatch.setattr(Config, 'max_wait', 60)
+    scheduler = Scheduler()
+
+    scheduler.acquire('av')
+    scheduler.acquire('av')
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitError) as error:
+        scheduler.acquire('av')
+    assert time.monotonic() - started < 1
+    assert "'av'" in error.value.msg and '43,200s' in error.value.msg
+
+    #the failed call left the queue, so the next one is not stuck behind it
+    with pytest.raises(RateLimitError):
+        scheduler.acquire('av')
+    assert time.monotonic() - started < 1
+
+def test_short_waits_are_paced(monkeypatch):
+    monkeypatch.setattr(Config, 'rate_limits', {'td': [(2, 0.2)]})
+    monkeypatch.setattr(Config, 'max_wait', 60)
+    scheduler = Scheduler()
+
+    started = time.monotonic()
+    for _ in range(4):
+        scheduler.acquire('td')
+    assert time.monotonic() - started >= 0.19
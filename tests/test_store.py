@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from finflux.base_var import Config
+
+store = __import__('finflux.store', fromlist=['store'])
+
+#------------------------------------------------------------------------------------------
+class provider:
+    #stand-in for yf.download over a set of daily histories that tests extend bar by bar,
+    #recording whether each call asked for the whole history or only the bars from a date on
+    def __init__(self):
+        self.histories = {}
+        self.calls = []
+
+    def bars(self, ticker, count, dividend_on=None):
+        index = pd.bdate_range('2026-01-05', periods=count, name='Date')
+        close = 100 + np.arange(count, dtype=float)
+        history = pd.DataFrame({'Open': close - 1, 'High': close + 1, 'Low': close - 2, 'Close': close,
+                                'Volume': np.full(count, 1000), 'Dividends': 0.0, 'Stock Splits': 0.0}, index=index)
+        if dividend_on is not None:
+            history.loc[index[dividend_on], 'Dividends'] = 0.5
+        self.histories[ticker] = history
+
+    def download(self, tickers, period=None, start=None, **kwargs):
+        self.calls.append('max' if period == 'max' else start)
+        frames = {ticker: self.histories[ticker] if start is None else self.histories[ticker][start:] for ticker in tickers}
+        return pd.concat(frames, axis=1)
+
+@pytest.fixture
+def prices(tmp_path, monkeypatch):
+    fake = provider()
+    monkeypatch.setattr(Config, 'cache_dir', str(tmp_path))
+    monkeypatch.setattr(store.yf, 'download', fake.download)
+    return store.price_store(), fake
+
+#------------------------------------------------------------------------------------------
+def test_incremental_update(prices):
+    price_store, fake = prices
+    fake.bars('AAPL', 10)
+    fake.bars('MSFT', 6)
+
+    first = price_store.histories(['AAPL', 'MSFT'])
+    assert fake.calls == ['max']
+    assert len(first['AAPL']) == 10 and len(first['MSFT']) == 6
+
+    fake.bars('AAPL', 12)
+    fake.bars('MSFT', 7)
+    second = price_store.histories(['AAPL', 'MSFT'])
+
+    #one bounded download from the earliest check bar, nothing downloaded in full again
+    assert fake.calls == ['max', '2026-01-09']
+    pd.testing.assert_frame_equal(second['AAPL'], fake.histories['AAPL'][store.fields], check_freq=False, check_dtype=False)
+    assert len(second['MSFT']) == 7
+
+def test_action_on_newest_bar_is_applied_once(prices):
+    price_store, fake = prices
+    fake.bars('SPY', 10, dividend_on=9)
+
+    price_store.history('SPY')
+    price_store.history('SPY')
+    assert fake.calls == ['max', '2026-01-15']
+
+    #the dividend now sits on the check bar, still not a reason to download everything
+    fake.bars('SPY', 11, dividend_on=9)
+    price_store.history('SPY')
+    assert fake.calls == ['max', '2026-01-15', '2026-01-15']
+    assert len(price_store.history('SPY')) == 11
+
+def test_new_action_downloads_full_history(prices):
+    price_store, fake = prices
+    fake.bars('SPY', 10)
+    price_store.history('SPY')
+
+    fake.bars('SPY', 11, dividend_on=10)
+    history = price_store.history('SPY')
+    assert fake.calls == ['max', '2026-01-15', 'max']
+    assert len(history) == 11
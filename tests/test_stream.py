@@ -0,0 +1,108 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+websockets_server = pytest.importorskip('websockets.sync.server')
+
+from finflux.base_var import Config
+from finflux.stream import stream
+
+#------------------------------------------------------------------------------------------
+def price(symbol, timestamp, value):
+    return json.dumps({'event': 'price', 'symbol': symbol, 'timestamp': timestamp, 'price': value})
+
+class stand_in:
+    #local stand-in for the Twelve Data price stream: every connection is answered with the
+    #next scripted list of messages, after which the server drops it (or keeps it open last)
+    def __init__(self, scripts):
+        self.scripts = list(scripts)
+        self.paths = []
+        self.subscriptions = []
+        self._server = websockets_server.serve(self._handler, 'localhost', 0)
+        self.url = f'ws://localhost:{self._server.socket.getsockname()[1]}/v1/quotes/price'
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _handler(self, connection):
+        self.paths.append(connection.request.path)
+        self.subscriptions.append(json.loads(connection.recv()))
+
+        script = self.scripts.pop(0)
+        for message in script:
+            connection.send(message)
+
+        if not self.scripts:
+            try:
+                while True:
+                    connection.recv()
+            except Exception:
+                pass
+
+    def shutdown(self):
+        self._server.shutdown()
+
+@pytest.fixture
+def config(monkeypatch):
+    monkeypatch.setattr(Config, 'td_apikey', 'KEY')
+    monkeypatch.setattr(Config, 'max_retries', 2)
+
+#------------------------------------------------------------------------------------------
+def test_subscribe_buffer_and_reconnect(config, monkeypatch):
+    status = json.dumps({'event': 'subscribe-status', 'status': 'ok',
+                         'success': [{'symbol': 'AAPL'}, {'symbol': 'EUR/USD'}], 'fails': [{'symbol': 'BAD'}]})
+    server = stand_in([
+        [status, price('AAPL', 1, 10.0), price('EUR/USD', 1, 1.1), price('AAPL', 2, 11.0)],
+        [status, price('AAPL', 3, 12.0), price('AAPL', 4, 13.0)],
+    ])
+    monkeypatch.setattr(Config, 'td_wsurl', server.url)
+
+    feed = stream(['AAPL', 'EUR/USD', 'BAD'], history=3)
+    ticks = []
+    try:
+        for tick in feed:
+            ticks.append(tick)
+            if len(ticks) == 5:
+                break
+    finally:
+        feed.close()
+        server.shutdown()
+
+    #the first connection was dropped after three ticks and the stream re-subscribed
+    assert len(server.subscriptions) == 2
+    assert server.subscriptions[0] == {'action': 'subscribe', 'params': {'symbols': 'AAPL,EUR/USD,BAD'}}
+    assert server.paths[0].endswith('?apikey=KEY')
+    assert feed.subscribed == ['AAPL', 'EUR/USD'] and feed.failed == ['BAD']
+
+    assert [tick['price'] for tick in ticks] == [10.0, 1.1, 11.0, 12.0, 13.0]
+    assert feed.latest('AAPL') == (4.0, 13.0)
+
+    #ring buffer of 3 keeps the newest ticks, oldest first
+    timestamps, prices = feed.snapshot('AAPL')
+    assert timestamps.tolist() == [2.0, 3.0, 4.0]
+    assert prices.tolist() == [11.0, 12.0, 13.0]
+
+    timestamps, prices = feed.snapshot('EUR/USD')
+    assert prices.tolist() == [1.1]
+
+def test_async_iteration(config, monkeypatch):
+    server = stand_in([[price('BTC/USD', 1, 60000.0), price('BTC/USD', 2, 60001.0)]])
+    monkeypatch.setattr(Config, 'td_wsurl', server.url)
+
+    feed = stream(['BTC/USD'])
+
+    async def consume():
+        ticks = []
+        async for tick in feed:
+            ticks.append(tick)
+            if len(ticks) == 2:
+                feed.close()
+        return ticks
+
+    try:
+        ticks = asyncio.run(consume())
+    finally:
+        server.shutdown()
+
+    assert [tick['timestamp'] for tick in ticks] == [1, 2]
+    assert feed.latest('BTC/USD') == (2.0, 60001.0)
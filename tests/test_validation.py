@@ -0,0 +1,38 @@
+import pytest
+
+validation = __import__('finflux.validation', fromlist=['validation'])
+
+#------------------------------------------------------------------------------------------
+@pytest.fixture
+def yahoo(monkeypatch):
+    #stand-ins for the batched quote endpoint, which leaves MSFT out of its response, and for
+    #the per symbol info lookup behind it
+    info_calls = []
+
+    class batch:
+        def get_raw_json(self, url, params):
+            return {'quoteResponse': {'result': [{'symbol': 'AAPL', 'quoteType': 'EQUITY'}]}}
+
+    class ticker:
+        def __init__(self, symbol):
+            self.symbol = symbol
+
+        def get_info(self):
+            info_calls.append(self.symbol)
+            return {'msft': {'quoteType': 'EQUITY'}}.get(self.symbol, {})
+
+    monkeypatch.setattr(validation, 'YfData', batch)
+    monkeypatch.setattr(validation.yf, 'Ticker', ticker)
+    monkeypatch.setattr(validation, '_quote_types', {})
+    return info_calls
+
+#------------------------------------------------------------------------------------------
+def test_partial_batch_response_falls_back_to_info(yahoo):
+    assert validation.quote_types(['aapl', 'msft', 'ZZZZ']) == {'aapl': 'EQUITY', 'msft': 'EQUITY', 'ZZZZ': None}
+
+    #only the symbols the batch left out were looked up one by one
+    assert sorted(yahoo) == ['ZZZZ', 'msft']
+
+    #and all three are served from the process cache afterwards
+    assert validation.quote_type('msft') == 'EQUITY'
+    assert sorted(yahoo) == ['ZZZZ', 'msft']